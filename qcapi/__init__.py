@@ -1,5 +1,5 @@
+from .cache import ResultCache
 from .client import QiskitRuntimeRestClient
 from .config import QcapiConfig
 
-__all__ = ["QcapiConfig", "QiskitRuntimeRestClient"]
-
+__all__ = ["QcapiConfig", "QiskitRuntimeRestClient", "ResultCache"]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import zlib
+from functools import cached_property
+from pathlib import Path
+
+from .exceptions import ConfigError
+
+
+DEFAULT_RESULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+class CachedResult:
+    # Nothing is read from disk until .raw or .data is accessed.
+    def __init__(self, path: Path):
+        self.path = path
+
+    @cached_property
+    def raw(self) -> bytes:
+        return zlib.decompress(self.path.read_bytes())
+
+    @cached_property
+    def data(self) -> object:
+        return json.loads(self.raw.decode("utf-8"))
+
+
+class ResultCache:
+    # On-disk cache for results of finished jobs (those never change).
+    # Entries are zlib-compressed JSON stored under the SHA-256 of the job ID.
+    # File mtimes double as LRU bookkeeping: hits touch the file and writes
+    # evict the least recently used entries until the cache fits in max_bytes.
+
+    def __init__(self, directory: str | os.PathLike[str], *, max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES):
+        if max_bytes < 1:
+            raise ConfigError("Result cache max_bytes must be >= 1")
+        self._dir = Path(directory).expanduser()
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> ResultCache | None:
+        directory = os.environ.get("QCAPI_RESULT_CACHE_DIR")
+        if not directory:
+            return None
+        raw_max = os.environ.get("QCAPI_RESULT_CACHE_MAX_BYTES")
+        if not raw_max:
+            return cls(directory)
+        try:
+            max_bytes = int(raw_max)
+        except ValueError as e:
+            raise ConfigError(f"Invalid QCAPI_RESULT_CACHE_MAX_BYTES: {raw_max!r}") from e
+        return cls(directory, max_bytes=max_bytes)
+
+    @property
+    def directory(self) -> Path:
+        return self._dir
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def open(self, job_id: str) -> CachedResult | None:
+        path = self._path(job_id)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return CachedResult(path)
+
+    def get(self, job_id: str) -> object | None:
+        entry = self.open(job_id)
+        if entry is None:
+            return None
+        try:
+            return entry.data
+        except (OSError, zlib.error, ValueError):
+            # Truncated/corrupt entry (or evicted underneath us); treat as a miss.
+            self.discard(job_id)
+            return None
+
+    def put(self, job_id: str, result: object) -> None:
+        blob = zlib.compress(json.dumps(result, separators=(",", ":")).encode("utf-8"))
+        if len(blob) > self._max_bytes:
+            return
+
+        path = self._path(job_id)
+        with self._lock:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(blob)
+            os.replace(tmp, path)
+            self._evict()
+
+    def discard(self, job_id: str) -> None:
+        try:
+            self._path(job_id).unlink()
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self._entries():
+                path.unlink(missing_ok=True)
+
+    def _path(self, job_id: str) -> Path:
+        digest = hashlib.sha256(job_id.encode("utf-8")).hexdigest()
+        return self._dir / f"{digest}.json.z"
+
+    def _entries(self) -> list[Path]:
+        try:
+            return list(self._dir.glob("*.json.z"))
+        except FileNotFoundError:
+            return []
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for path in self._entries():
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+            total += st.st_size
+        if total <= self._max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            path.unlink(missing_ok=True)
+            total -= size
+            if total <= self._max_bytes:
+                break
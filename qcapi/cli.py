@@ -3,17 +3,33 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from datetime import datetime
 from pathlib import Path
 
-from .client import QiskitRuntimeRestClient
+from .cache import ResultCache
+from .client import JobOutcome, QiskitRuntimeRestClient
 from .config import QcapiConfig
 from .exceptions import ConfigError, HttpError
+from .jobs import (
+    JOB_SORT_KEYS,
+    JobIndex,
+    extract_items,
+    first_string,
+    is_terminal_status,
+    iter_job_records,
+    job_records,
+    job_status,
+    normalize_status,
+    parse_timestamp,
+)
+from .usage import UsageReporter
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(prog="qcapi", description="IBM Quantum Qiskit Runtime REST API helper")
     parser.add_argument("--account", help="Account name from ~/.qiskit/qiskit-ibm.json (default: auto)")
     parser.add_argument("--raw", action="store_true", help="Print raw JSON (no formatting)")
+    parser.add_argument("--max-rps", type=float, help="Limit API requests per second (default: unlimited)")
 
     sub = parser.add_subparsers(dest="cmd", required=True)
 
@@ -40,14 +56,47 @@ def main(argv: list[str] | None = None) -> int:
         help="Show recent jobs that ran on a quantum backend (no simulator)",
     )
     sp.add_argument("--limit", type=int, default=5, help="How many jobs to show (default: 5)")
+    sp.add_argument("--status", action="append", help="Only jobs with this status (repeatable, case-insensitive)")
+    sp.add_argument("--since", help="Only jobs created at/after this ISO date/time (UTC if no offset)")
+    sp.add_argument("--program", action="append", help="Only jobs of this program id (repeatable)")
+    sp.add_argument(
+        "--exclude-simulators",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Skip jobs that ran on a simulator backend (default: on)",
+    )
+    sp.add_argument("--sort", choices=JOB_SORT_KEYS, help="Sort the selected jobs (default: API order)")
 
     sp = sub.add_parser("job", help="GET /jobs/{job_id}")
     sp.add_argument("job_id")
     sp = sub.add_parser("job-results", help="GET /jobs/{job_id}/results")
     sp.add_argument("job_id")
+    sp = sub.add_parser("job-follow", help="Tail a job's interim results (like tail -f), then print its final results")
+    sp.add_argument("job_id")
+    sp.add_argument("--max-interval", type=float, default=10.0, help="Max seconds between polls (default: 10)")
     sp = sub.add_parser("job-cancel", help="POST /jobs/{job_id}/cancel")
     sp.add_argument("job_id")
 
+    sp = sub.add_parser("jobs-cancel", help="Cancel many pending jobs concurrently")
+    sp.add_argument(
+        "--filter",
+        choices=("pending", "queued", "running"),
+        default="pending",
+        help="Which jobs to cancel: all pending (queued+running), or only queued/running (default: pending)",
+    )
+    sp.add_argument("--backend")
+    sp.add_argument("--program-id")
+    sp.add_argument("--limit", type=int, help="Cancel at most this many jobs")
+    sp.add_argument("--workers", type=int, default=8, help="Concurrent cancel requests (default: 8)")
+    sp.add_argument("--dry-run", action="store_true", help="Only list the jobs that would be cancelled")
+
+    sp = sub.add_parser("usage", help="Aggregate QPU seconds per backend/program/day from job metrics")
+    sp.add_argument("--since", help="Only jobs created at/after this ISO date/time (UTC if no offset)")
+    sp.add_argument("--until", help="Only jobs created before this ISO date/time (UTC if no offset)")
+    sp.add_argument("--backend")
+    sp.add_argument("--program-id")
+    sp.add_argument("--workers", type=int, default=8, help="Concurrent metrics requests (default: 8)")
+
     sp = sub.add_parser("request", help="Arbitrary request (for endpoints not wrapped by this CLI)")
     sp.add_argument("method", help="GET/POST/PUT/PATCH/DELETE")
     sp.add_argument("path", help="API path (e.g. /jobs)")
@@ -61,7 +110,9 @@ def main(argv: list[str] | None = None) -> int:
 
     try:
         cfg = QcapiConfig.load(account_name=args.account)
-        client = QiskitRuntimeRestClient(cfg)
+        if args.max_rps is not None and args.max_rps <= 0:
+            raise SystemExit("--max-rps must be > 0")
+        client = QiskitRuntimeRestClient(cfg, result_cache=ResultCache.from_env(), max_requests_per_s=args.max_rps)
         out = _run(client, args)
     except (ConfigError, HttpError) as e:
         print(f"error: {e}", file=sys.stderr)
@@ -118,13 +169,42 @@ def _run(client: QiskitRuntimeRestClient, args: argparse.Namespace) -> object:
         }
         return client.list_jobs(**query)
     if cmd == "recent-quantum-jobs":
-        return _recent_quantum_jobs(client, limit=args.limit)
+        return _recent_quantum_jobs(
+            client,
+            limit=args.limit,
+            statuses=args.status,
+            since=_parse_time_arg("--since", args.since),
+            programs=args.program,
+            exclude_simulators=args.exclude_simulators,
+            sort=args.sort,
+        )
     if cmd == "job":
         return client.get_job(args.job_id)
     if cmd == "job-results":
         return client.get_job_results(args.job_id)
+    if cmd == "job-follow":
+        return _job_follow(client, args.job_id, max_interval_s=args.max_interval, raw=args.raw)
     if cmd == "job-cancel":
         return client.cancel_job(args.job_id)
+    if cmd == "jobs-cancel":
+        return _jobs_cancel(
+            client,
+            status_filter=args.filter,
+            backend=args.backend,
+            program_id=args.program_id,
+            limit=args.limit,
+            workers=args.workers,
+            dry_run=args.dry_run,
+        )
+    if cmd == "usage":
+        if args.workers < 1:
+            raise SystemExit("--workers must be >= 1")
+        return UsageReporter(client, max_workers=args.workers, metrics_cache=client.result_cache).report(
+            since=_parse_time_arg("--since", args.since),
+            until=_parse_time_arg("--until", args.until),
+            backend=args.backend,
+            program_id=args.program_id,
+        )
     if cmd == "request":
         params = _parse_params(args.param)
         body = None
@@ -152,88 +232,153 @@ def _parse_params(items: list[str]) -> dict[str, str]:
     return out
 
 
-def _recent_quantum_jobs(client: QiskitRuntimeRestClient, *, limit: int = 5) -> list[dict[str, object]]:
-    if limit < 1:
-        raise SystemExit("--limit must be >= 1")
-
-    backend_items = _extract_items(client.list_backends(), ("backends", "devices", "items", "results", "data"))
-    quantum_backends = {
-        name
-        for backend in backend_items
-        for name in [_first_string(backend, ("name", "backend_name", "backend", "id"))]
-        if name and not _is_simulator_backend(backend)
-    }
-    if not quantum_backends:
-        return []
-
-    scan_limit = max(limit * 20, limit)
-    job_items = _extract_items(
-        client.list_jobs(limit=scan_limit, pending="false"),
-        ("jobs", "items", "results", "data"),
+def _parse_time_arg(flag: str, value: str | None) -> datetime | None:
+    if value is None:
+        return None
+    parsed = parse_timestamp(value)
+    if parsed is None:
+        raise SystemExit(f"{flag} must be an ISO date/time, got: {value!r}")
+    return parsed
+
+
+def _job_follow(
+    client: QiskitRuntimeRestClient,
+    job_id: str,
+    *,
+    max_interval_s: float = 10.0,
+    raw: bool = False,
+) -> object:
+    # Status changes and interim entries are printed as they arrive (one
+    # compact line each with --raw, indented otherwise); the final results (or
+    # the last job status for failed/cancelled jobs) are returned so main()
+    # prints them like any other command. Ctrl-C stops following (exit 130).
+    if max_interval_s <= 0:
+        raise SystemExit("--max-interval must be > 0")
+
+    def emit(obj: object) -> None:
+        if raw:
+            print(json.dumps(obj), flush=True)
+        else:
+            print(json.dumps(obj, indent=2, sort_keys=True), flush=True)
+
+    final: object = None
+    events = client.iter_interim_results(
+        job_id,
+        min_interval_s=min(1.0, max_interval_s),
+        max_interval_s=max_interval_s,
+        queued_interval_s=max_interval_s,
     )
+    try:
+        for event in events:
+            if event.kind == "result":
+                final = event.data
+                continue
+            if event.kind == "status":
+                final = event.data
+                emit({"status": job_status(event.data)})
+            else:
+                emit({"interim": event.data})
+    except KeyboardInterrupt:
+        raise SystemExit(130) from None
+    return final
+
+
+def _jobs_cancel(
+    client: QiskitRuntimeRestClient,
+    *,
+    status_filter: str = "pending",
+    backend: str | None = None,
+    program_id: str | None = None,
+    limit: int | None = None,
+    workers: int = 8,
+    dry_run: bool = False,
+) -> dict[str, object]:
+    if limit is not None and limit < 1:
+        raise SystemExit("--limit must be >= 1")
+    if workers < 1:
+        raise SystemExit("--workers must be >= 1")
 
-    out: list[dict[str, object]] = []
-    for job in job_items:
-        backend_name = _job_backend_name(job)
-        if not backend_name or backend_name not in quantum_backends:
-            continue
-
-        job_id = _first_string(job, ("id", "job_id", "jobId"))
-        if not job_id:
+    targets: list[str] = []
+    # Lazily, so --limit stops paging early even when the queue is flooded.
+    for record in iter_job_records(client.iter_jobs(pending="true", backend=backend, program_id=program_id)):
+        if status_filter != "pending" and normalize_status(record.status) != status_filter.upper():
             continue
+        targets.append(record.id)
+        if limit is not None and len(targets) >= limit:
+            break
 
-        row: dict[str, object] = {"id": job_id, "backend": backend_name}
-        status = _first_string(job, ("status", "state"))
-        if status:
-            row["status"] = status
-        created = _first_string(job, ("created", "created_at", "creation_date"))
-        if created:
-            row["created"] = created
+    if dry_run:
+        return {"selected": len(targets), "job_ids": targets}
 
-        out.append(row)
-        if len(out) >= limit:
-            break
+    def report(done: int, total: int, outcome: JobOutcome) -> None:
+        state = "ok" if outcome.ok else f"failed ({outcome.status}: {outcome.error})"
+        print(f"[{done}/{total}] {outcome.job_id} {state}", file=sys.stderr)
 
-    return out
+    outcomes = client.cancel_jobs_many(targets, max_workers=workers, progress=report)
+    return {
+        "selected": len(targets),
+        "cancelled": sum(1 for o in outcomes if o.ok),
+        "failed": sum(1 for o in outcomes if not o.ok),
+        "outcomes": [o.as_dict() for o in outcomes],
+    }
 
 
-def _extract_items(payload: object, candidate_keys: tuple[str, ...]) -> list[dict[str, object]]:
-    if isinstance(payload, list):
-        return [item for item in payload if isinstance(item, dict)]
-    if isinstance(payload, dict):
-        for key in candidate_keys:
-            value = payload.get(key)
-            if isinstance(value, list):
-                return [item for item in value if isinstance(item, dict)]
-    return []
+def _recent_quantum_jobs(
+    client: QiskitRuntimeRestClient,
+    *,
+    limit: int = 5,
+    statuses: list[str] | None = None,
+    since: datetime | None = None,
+    programs: list[str] | None = None,
+    exclude_simulators: bool = True,
+    sort: str | None = None,
+) -> list[dict[str, object]]:
+    if limit < 1:
+        raise SystemExit("--limit must be >= 1")
 
+    quantum_backends: set[str] | None = None
+    if exclude_simulators:
+        backend_items = extract_items(client.list_backends(), ("backends", "devices", "items", "results", "data"))
+        quantum_backends = {
+            name
+            for backend in backend_items
+            for name in [first_string(backend, ("name", "backend_name", "backend", "id"))]
+            if name and not _is_simulator_backend(backend)
+        }
+        if not quantum_backends:
+            return []
 
-def _first_string(item: object, keys: tuple[str, ...]) -> str | None:
-    if not isinstance(item, dict):
-        return None
-    for key in keys:
-        value = item.get(key)
-        if isinstance(value, str) and value:
-            return value
-    return None
+    # Finished jobs only, unless a queued/running status was asked for explicitly.
+    pending = "false"
+    if statuses and not all(is_terminal_status(s) for s in statuses):
+        pending = None
 
+    scan_limit = max(limit * 20, limit)
+    job_items = extract_items(
+        client.list_jobs(limit=scan_limit, pending=pending),
+        ("jobs", "items", "results", "data"),
+    )
 
-def _job_backend_name(job: dict[str, object]) -> str | None:
-    backend = job.get("backend")
-    if isinstance(backend, str) and backend:
-        return backend
-    if isinstance(backend, dict):
-        nested = _first_string(backend, ("name", "backend_name", "id"))
-        if nested:
-            return nested
-    return _first_string(job, ("backend_name", "device", "target"))
+    index = JobIndex([record for record in job_records(job_items) if record.backend])
+    records = index.query(
+        statuses=statuses,
+        backends=quantum_backends,
+        programs=programs,
+        since=since,
+        sort=sort,
+        limit=limit,
+    )
+    # Only show the program when it was asked about, so the default rows stay
+    # id/backend/status/created.
+    include_program = bool(programs) or sort == "program"
+    return [record.as_row(include_program=include_program) for record in records]
 
 
 def _is_simulator_backend(backend: dict[str, object]) -> bool:
     for key in ("simulator", "is_simulator"):
         if key in backend:
             return _as_bool(backend.get(key))
-    name = _first_string(backend, ("name", "backend_name", "backend", "id"))
+    name = first_string(backend, ("name", "backend_name", "backend", "id"))
     return bool(name and "simulator" in name.lower())
 
 
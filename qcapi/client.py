@@ -1,25 +1,198 @@
 from __future__ import annotations
 
+import hashlib
+import http.client
 import json
+import threading
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
 
 from .auth import IbmCloudIamTokenProvider
+from .cache import ResultCache
 from .config import QcapiConfig
-from .exceptions import HttpError
+from .exceptions import BodyTooLargeError, CircuitOpenError, HttpError
+from .jobs import SUCCESS_JOB_STATUSES, extract_items, first_string, is_terminal_status, job_status, normalize_status
+
+
+_CHUNK_SIZE = 64 * 1024
+
+# Per endpoint class: "results" covers /results and /interim_results, "error"
+# caps how much of a non-2xx body ends up on HttpError.body.
+DEFAULT_MAX_BODY_BYTES: dict[str, int] = {
+    "default": 16 * 1024 * 1024,
+    "results": 512 * 1024 * 1024,
+    "error": 64 * 1024,
+}
+
+
+class RateLimiter:
+    # Spaces calls at least 1/rate_per_s apart across all threads.
+    def __init__(self, rate_per_s: float):
+        if rate_per_s <= 0:
+            raise ValueError("rate_per_s must be > 0")
+        self._interval_s = 1.0 / rate_per_s
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait_s = self._next_at - now
+            self._next_at = max(now, self._next_at) + self._interval_s
+        if wait_s > 0:
+            time.sleep(wait_s)
+
+
+class CircuitBreaker:
+    # Per-host breaker: after failure_threshold consecutive failures (network
+    # errors, timeouts, 5xx) calls fail fast for reset_timeout_s. After that a
+    # single probe is let through (half-open); its outcome closes the breaker
+    # or opens it again.
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout_s: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_s = reset_timeout_s
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._probing or self._clock() - self._opened_at >= self._reset_timeout_s:
+                return "half-open"
+            return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or self._clock() - self._opened_at < self._reset_timeout_s:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self._failure_threshold:
+                self._opened_at = self._clock()
+            self._probing = False
+
+    def release(self) -> None:
+        # The call ended without saying anything about the host (bad URL,
+        # KeyboardInterrupt, ...): free a half-open probe slot, count nothing.
+        with self._lock:
+            self._probing = False
+
+
+class _LatencyTracker:
+    # Rolling window of successful GET latencies, used to pick the hedge delay.
+    def __init__(self, *, window: int = 200, min_samples: int = 20):
+        self._samples: deque[float] = deque(maxlen=window)
+        self._min_samples = min_samples
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def p95(self) -> float | None:
+        with self._lock:
+            if len(self._samples) < self._min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+
+
+@dataclass(frozen=True)
+class JobOutcome:
+    job_id: str
+    ok: bool
+    status: int | None = None
+    error: str | None = None
+
+    def as_dict(self) -> dict[str, object]:
+        out: dict[str, object] = {"id": self.job_id, "ok": self.ok}
+        if self.status is not None:
+            out["status"] = self.status
+        if self.error:
+            out["error"] = self.error
+        return out
+
+
+@dataclass(frozen=True)
+class JobEvent:
+    # kind is "status" (job status changed), "interim" (one new interim
+    # result entry) or "result" (final results of a successful job).
+    kind: str
+    data: object
+
+    def as_dict(self) -> dict[str, object]:
+        return {"kind": self.kind, "data": self.data}
 
 
 class QiskitRuntimeRestClient:
-    def __init__(self, config: QcapiConfig, *, timeout_s: float = 30.0):
+    def __init__(
+        self,
+        config: QcapiConfig,
+        *,
+        timeout_s: float = 30.0,
+        result_cache: ResultCache | None = None,
+        max_body_bytes: dict[str, int] | None = None,
+        max_requests_per_s: float | None = None,
+        circuit_breaker_threshold: int | None = 5,
+        circuit_breaker_reset_s: float = 30.0,
+        hedge_gets: bool = False,
+        hedge_delay_s: float = 1.0,
+    ):
         self._cfg = config
         self._timeout_s = timeout_s
+        self._result_cache = result_cache
+        self._max_body_bytes = {**DEFAULT_MAX_BODY_BYTES, **(max_body_bytes or {})}
+        self._rate_limiter = RateLimiter(max_requests_per_s) if max_requests_per_s else None
+        self._breaker_threshold = circuit_breaker_threshold
+        self._breaker_reset_s = circuit_breaker_reset_s
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._hedge_gets = hedge_gets
+        # Used until enough latencies are recorded to derive a p95.
+        self._hedge_delay_s = hedge_delay_s
+        self._latency: dict[str, _LatencyTracker] = {}
+        self._hedge_threads: set[threading.Thread] = set()
+        self._state_lock = threading.Lock()
         self._token_provider = IbmCloudIamTokenProvider(config.ibm_cloud_api_key, timeout_s=timeout_s)
 
     @property
     def config(self) -> QcapiConfig:
         return self._cfg
 
+    @property
+    def result_cache(self) -> ResultCache | None:
+        return self._result_cache
+
     def get_versions(self) -> object:
         return self._request_json("GET", "/versions", need_auth=False, need_crn=False, include_api_version_header=False)
 
@@ -42,6 +215,28 @@ class QiskitRuntimeRestClient:
         # Accepts arbitrary query params; callers can pass limit=..., backend=..., program_id=..., pending=true, ...
         return self._request_json("GET", "/jobs", params=query or None)
 
+    def iter_jobs(self, *, page_size: int = 100, **query: object) -> Iterator[dict[str, object]]:
+        # Walks GET /jobs page by page (limit/skip). A short page is not taken
+        # as the end, since the server may cap limit below page_size; paging
+        # stops at the first page without any job ID not seen before, which
+        # also ends the loop if the server ignores skip.
+        skip = int(query.pop("skip", None) or 0)
+        seen: set[str] = set()
+        while True:
+            page = extract_items(self.list_jobs(**query, limit=page_size, skip=skip), ("jobs", "items", "results", "data"))
+            fresh = False
+            for job in page:
+                job_id = first_string(job, ("id", "job_id", "jobId"))
+                if job_id is not None:
+                    if job_id in seen:
+                        continue
+                    seen.add(job_id)
+                    fresh = True
+                yield job
+            if not fresh:
+                return
+            skip += len(page)
+
     def get_job(self, job_id: str) -> object:
         return self._request_json("GET", f"/jobs/{urllib.parse.quote(job_id)}")
 
@@ -51,12 +246,98 @@ class QiskitRuntimeRestClient:
     def cancel_job(self, job_id: str) -> object:
         return self._request_json("POST", f"/jobs/{urllib.parse.quote(job_id)}/cancel")
 
-    def get_job_results(self, job_id: str) -> object:
-        return self._request_json("GET", f"/jobs/{urllib.parse.quote(job_id)}/results")
+    def cancel_jobs_many(
+        self,
+        job_ids: Iterable[str],
+        *,
+        max_workers: int = 8,
+        progress: Callable[[int, int, JobOutcome], None] | None = None,
+    ) -> list[JobOutcome]:
+        return self._run_many(self.cancel_job, job_ids, max_workers=max_workers, progress=progress)
+
+    def delete_jobs_many(
+        self,
+        job_ids: Iterable[str],
+        *,
+        max_workers: int = 8,
+        progress: Callable[[int, int, JobOutcome], None] | None = None,
+    ) -> list[JobOutcome]:
+        return self._run_many(self.delete_job, job_ids, max_workers=max_workers, progress=progress)
+
+    def get_job_results(self, job_id: str, *, assume_terminal: bool = False) -> object:
+        # With a result cache this returns the parsed result; use
+        # result_cache.open(job_id) for lazy access to a cached entry.
+        # Pass assume_terminal=True when the caller already saw a terminal
+        # status, to skip the extra GET /jobs/{id} on a cache miss.
+        path = f"/jobs/{urllib.parse.quote(job_id)}/results"
+        cache = self._result_cache
+        if cache is None:
+            return self._request_json("GET", path)
+
+        cached = cache.get(job_id)
+        if cached is not None:
+            return cached
+        # Only results of terminal jobs are immutable; check before fetching so
+        # a job finishing mid-call can't leave a partial result in the cache.
+        terminal = assume_terminal or is_terminal_status(job_status(self.get_job(job_id)))
+        result = self._request_json("GET", path)
+        if terminal and result is not None:
+            cache.put(job_id, result)
+        return result
 
     def get_job_interim_results(self, job_id: str) -> object:
         return self._request_json("GET", f"/jobs/{urllib.parse.quote(job_id)}/interim_results")
 
+    def iter_interim_results(
+        self,
+        job_id: str,
+        *,
+        min_interval_s: float = 1.0,
+        max_interval_s: float = 10.0,
+        queued_interval_s: float = 10.0,
+    ) -> Iterator[JobEvent]:
+        # Polls a job and yields only interim entries not seen before, then the
+        # final results. While queued it polls slowly; while running it starts
+        # at min_interval_s and backs off (x1.5, up to max_interval_s) as long
+        # as nothing new shows up.
+        seen = _InterimCursor()
+        last_status: str | None = None
+        interval_s = min_interval_s
+        while True:
+            job = self.get_job(job_id)
+            status = job_status(job)
+            if status != last_status:
+                last_status = status
+                yield JobEvent("status", job)
+
+            terminal = is_terminal_status(status)
+            new_entries: list[object] = []
+            if terminal or normalize_status(status) == "RUNNING":
+                new_entries = seen.advance(self._interim_entries(job_id))
+            for entry in new_entries:
+                yield JobEvent("interim", entry)
+
+            if terminal:
+                if normalize_status(status) in SUCCESS_JOB_STATUSES:
+                    yield JobEvent("result", self.get_job_results(job_id, assume_terminal=True))
+                return
+
+            if normalize_status(status) != "RUNNING":
+                interval_s = min_interval_s
+                time.sleep(queued_interval_s)
+                continue
+            interval_s = min_interval_s if new_entries else min(interval_s * 1.5, max_interval_s)
+            time.sleep(interval_s)
+
+    def _interim_entries(self, job_id: str) -> list[object]:
+        try:
+            payload = self.get_job_interim_results(job_id)
+        except HttpError as e:
+            if e.status == 404:
+                return []
+            raise
+        return _interim_entries(payload)
+
     def get_job_metrics(self, job_id: str) -> object:
         return self._request_json("GET", f"/jobs/{urllib.parse.quote(job_id)}/metrics")
 
@@ -105,6 +386,86 @@ class QiskitRuntimeRestClient:
             include_api_version_header=include_api_version_header,
         )
 
+    def stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, object] | None = None,
+        json_body: object | None = None,
+        chunk_size: int = _CHUNK_SIZE,
+        max_bytes: int | None = None,
+        need_auth: bool = True,
+        need_crn: bool = True,
+        include_api_version_header: bool = True,
+    ) -> Iterator[bytes]:
+        # Yields the raw response body in chunks instead of buffering it.
+        # The request is only sent once iteration starts.
+        url, req = self._build_request(
+            method,
+            path,
+            params=params,
+            json_body=json_body,
+            need_auth=need_auth,
+            need_crn=need_crn,
+            include_api_version_header=include_api_version_header,
+        )
+        resp, _ = self._open(req, url)
+        breaker = self._breaker(url)
+        with resp:
+            total = 0
+            try:
+                while True:
+                    chunk = resp.read(chunk_size)
+                    if not chunk:
+                        break
+                    total += len(chunk)
+                    if max_bytes is not None and total > max_bytes:
+                        raise BodyTooLargeError(max_bytes, url=url)
+                    yield chunk
+            except BaseException as e:
+                raise self._body_read_error(breaker, url, e)
+        if breaker is not None:
+            breaker.record_success()
+
+    def _run_many(
+        self,
+        fn: Callable[[str], object],
+        job_ids: Iterable[str],
+        *,
+        max_workers: int,
+        progress: Callable[[int, int, JobOutcome], None] | None,
+    ) -> list[JobOutcome]:
+        # Runs fn for every job concurrently (still subject to the client's
+        # rate limiter); failures are collected per job instead of raised.
+        # Outcomes are returned in input order; progress sees completion order.
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        ids = list(dict.fromkeys(job_ids))
+        if not ids:
+            return []
+        # Fetch the IAM token once up front rather than from every worker.
+        self._token_provider.get_token()
+
+        def run_one(job_id: str) -> JobOutcome:
+            try:
+                fn(job_id)
+            except HttpError as e:
+                return JobOutcome(job_id, ok=False, status=e.status, error=str(e))
+            except Exception as e:
+                return JobOutcome(job_id, ok=False, error=f"{type(e).__name__}: {e}")
+            return JobOutcome(job_id, ok=True)
+
+        outcomes: dict[str, JobOutcome] = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ids))) as pool:
+            futures = [pool.submit(run_one, job_id) for job_id in ids]
+            for done, future in enumerate(as_completed(futures), start=1):
+                outcome = future.result()
+                outcomes[outcome.job_id] = outcome
+                if progress is not None:
+                    progress(done, len(ids), outcome)
+        return [outcomes[job_id] for job_id in ids]
+
     def _request_json(
         self,
         method: str,
@@ -116,6 +477,124 @@ class QiskitRuntimeRestClient:
         need_crn: bool = True,
         include_api_version_header: bool = True,
     ) -> object:
+        body_class = _body_class(path)
+        # Only small GETs are hedged and timed: /results downloads would both
+        # double the transfer and skew the p95 used for status polling.
+        latency_sensitive = method.upper() == "GET" and body_class == "default"
+
+        def fetch() -> object:
+            url, req = self._build_request(
+                method,
+                path,
+                params=params,
+                json_body=json_body,
+                need_auth=need_auth,
+                need_crn=need_crn,
+                include_api_version_header=include_api_version_header,
+            )
+            resp, started = self._open(req, url)
+            raw = self._read_body(resp, url, self._max_body_bytes[body_class])
+            if latency_sensitive:
+                self._latency_tracker(url).record(time.monotonic() - started)
+            return _maybe_json(raw)
+
+        if latency_sensitive and self._hedge_gets:
+            return self._hedged(fetch)
+        return fetch()
+
+    def close(self, *, wait_s: float = 0.0) -> None:
+        # Stops hedging. Losing hedge attempts run on daemon threads and never
+        # hold up interpreter exit; wait_s optionally waits for them to finish.
+        with self._state_lock:
+            self._hedge_gets = False
+            threads = list(self._hedge_threads)
+        deadline = time.monotonic() + wait_s
+        for thread in threads:
+            thread.join(max(deadline - time.monotonic(), 0.0))
+
+    def __enter__(self) -> QiskitRuntimeRestClient:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _hedged(self, fetch: Callable[[], object]) -> object:
+        # GETs are idempotent, so when the first attempt is slower than the
+        # host's p95 a second one is sent and whichever succeeds first wins.
+        # Each attempt gets its own thread, so attempts never queue behind
+        # other callers' requests and the delay counts from the real start.
+        first = self._start_attempt(fetch)
+        done, _ = wait([first], timeout=self._hedge_delay_for(self._cfg.base_url))
+        if done:
+            return first.result()
+
+        pending = {first, self._start_attempt(fetch)}
+        error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                exc = future.exception()
+                if exc is None:
+                    return future.result()
+                error = exc
+        assert error is not None
+        raise error
+
+    def _start_attempt(self, fetch: Callable[[], object]) -> Future:
+        future: Future = Future()
+
+        def run() -> None:
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fetch())
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                with self._state_lock:
+                    self._hedge_threads.discard(thread)
+
+        thread = threading.Thread(target=run, name="qcapi-hedge", daemon=True)
+        with self._state_lock:
+            self._hedge_threads.add(thread)
+        thread.start()
+        return future
+
+    def _hedge_delay_for(self, url: str) -> float:
+        p95 = self._latency_tracker(url).p95()
+        return self._hedge_delay_s if p95 is None else max(p95, 0.01)
+
+    def _latency_tracker(self, url: str) -> _LatencyTracker:
+        host = urllib.parse.urlsplit(url).netloc
+        with self._state_lock:
+            tracker = self._latency.get(host)
+            if tracker is None:
+                tracker = self._latency[host] = _LatencyTracker()
+            return tracker
+
+    def _breaker(self, url: str) -> CircuitBreaker | None:
+        if self._breaker_threshold is None:
+            return None
+        host = urllib.parse.urlsplit(url).netloc
+        with self._state_lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(
+                    failure_threshold=self._breaker_threshold, reset_timeout_s=self._breaker_reset_s
+                )
+            return breaker
+
+    def _build_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, object] | None,
+        json_body: object | None,
+        need_auth: bool,
+        need_crn: bool,
+        include_api_version_header: bool,
+    ) -> tuple[str, urllib.request.Request]:
         url = self._cfg.base_url.rstrip("/") + "/" + path.lstrip("/")
 
         if params:
@@ -141,27 +620,188 @@ class QiskitRuntimeRestClient:
             headers["Content-Type"] = "application/json"
             data = json.dumps(json_body).encode("utf-8")
 
-        req = urllib.request.Request(url, data=data, headers=headers, method=method.upper())
+        return url, urllib.request.Request(url, data=data, headers=headers, method=method.upper())
 
+    def _read_body(self, resp: http.client.HTTPResponse, url: str, limit: int) -> bytes:
+        breaker = self._breaker(url)
         try:
-            with urllib.request.urlopen(req, timeout=self._timeout_s) as resp:
-                raw = resp.read()
-                status = getattr(resp, "status", 200)
+            with resp:
+                raw = _read_limited(resp, limit, url=url)
+        except BaseException as e:
+            raise self._body_read_error(breaker, url, e)
+        if breaker is not None:
+            breaker.record_success()
+        return raw
+
+    def _body_read_error(self, breaker: CircuitBreaker | None, url: str, e: BaseException) -> BaseException:
+        # Settles the breaker for an exception raised while reading a 2xx body
+        # and returns the exception to raise in its place.
+        if isinstance(e, (OSError, http.client.HTTPException)):
+            if breaker is not None:
+                breaker.record_failure()
+            err = HttpError(None, f"HTTP response read failed: {e or type(e).__name__}", url=url)
+            err.__cause__ = e
+            return err
+        if breaker is not None:
+            if isinstance(e, (BodyTooLargeError, GeneratorExit)):
+                # The host answered fine; the caller just doesn't want the rest.
+                breaker.record_success()
+            else:
+                breaker.release()
+        return e
+
+    def _open(self, req: urllib.request.Request, url: str) -> tuple[http.client.HTTPResponse, float]:
+        # Returns the open response for a 2xx plus the monotonic time the
+        # request was actually sent (after any rate-limiter wait); anything
+        # else becomes an HttpError carrying (at most max_body_bytes["error"]
+        # of) the body.
+        error_limit = self._max_body_bytes["error"]
+        breaker = self._breaker(url)
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(urllib.parse.urlsplit(url).netloc, url=url)
+        try:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            started = time.monotonic()
+            resp = urllib.request.urlopen(req, timeout=self._timeout_s)
         except urllib.error.HTTPError as e:
-            raw = e.read()
-            raise HttpError(getattr(e, "code", None), "HTTP request failed", url=url, body=_maybe_json(raw)) from e
+            code = getattr(e, "code", None)
+            if breaker is not None:
+                if code is not None and code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            raw, truncated = _read_prefix(e, error_limit)
+            raise HttpError(code, "HTTP request failed", url=url, body=_maybe_json(raw, truncated=truncated)) from e
         except urllib.error.URLError as e:
+            if breaker is not None:
+                breaker.record_failure()
             raise HttpError(None, f"HTTP request failed: {e}", url=url) from e
-
+        except (OSError, http.client.HTTPException) as e:
+            # Timeouts, dropped connections and garbled responses that urllib
+            # doesn't wrap in URLError.
+            if breaker is not None:
+                breaker.record_failure()
+            raise HttpError(None, f"HTTP request failed: {e or type(e).__name__}", url=url) from e
+        except BaseException:
+            # Caller-side problems (ValueError for a bad URL, KeyboardInterrupt
+            # during the rate-limiter sleep, ...) say nothing about the host;
+            # just make sure a half-open probe slot is freed.
+            if breaker is not None:
+                breaker.release()
+            raise
+
+        status = getattr(resp, "status", 200)
         if status < 200 or status >= 300:
-            raise HttpError(status, "HTTP request failed", url=url, body=_maybe_json(raw))
-
-        return _maybe_json(raw)
+            if breaker is not None:
+                if status >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            with resp:
+                raw, truncated = _read_prefix(resp, error_limit)
+            raise HttpError(status, "HTTP request failed", url=url, body=_maybe_json(raw, truncated=truncated))
+        # For a 2xx the breaker is settled by the caller once the body has
+        # been read (see _read_body): a host that sends headers and then
+        # stalls is still failing.
+        return resp, started
+
+
+class _InterimCursor:
+    # Tracks how many interim entries were already yielded, plus a hash of the
+    # last one to notice when the server returns a different list (e.g. a
+    # truncated window) so only unseen entries are yielded in that case.
+    def __init__(self) -> None:
+        self._offset = 0
+        self._last_hash: str | None = None
+        self._seen: set[str] = set()
+
+    def advance(self, entries: list[object]) -> list[object]:
+        hashes = [_entry_hash(entry) for entry in entries]
+        if self._offset <= len(entries) and (self._offset == 0 or hashes[self._offset - 1] == self._last_hash):
+            fresh = list(range(self._offset, len(entries)))
+        else:
+            fresh = [i for i, h in enumerate(hashes) if h not in self._seen]
+        for i in fresh:
+            self._seen.add(hashes[i])
+        if entries:
+            self._offset = len(entries)
+            self._last_hash = hashes[-1]
+        return [entries[i] for i in fresh]
+
+
+def _entry_hash(entry: object) -> str:
+    raw = json.dumps(entry, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _interim_entries(payload: object) -> list[object]:
+    # The endpoint has returned a list, a newline-delimited JSON string and a
+    # wrapping object over time.
+    if payload is None:
+        return []
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict):
+        for key in ("interim_results", "results", "data"):
+            value = payload.get(key)
+            if isinstance(value, list):
+                return value
+        return [payload]
+    if isinstance(payload, str):
+        entries: list[object] = []
+        for line in payload.splitlines():
+            line = line.strip()
+            if line:
+                entries.append(_maybe_json(line.encode("utf-8")))
+        return entries
+    return [payload]
+
+
+def _body_class(path: str) -> str:
+    endpoint = path.split("?", 1)[0].rstrip("/")
+    if endpoint.endswith("/results") or endpoint.endswith("/interim_results"):
+        return "results"
+    return "default"
+
+
+def _read_limited(resp, limit: int, *, url: str) -> bytes:
+    declared = resp.headers.get("Content-Length") if getattr(resp, "headers", None) is not None else None
+    if declared and declared.isdigit() and int(declared) > limit:
+        raise BodyTooLargeError(limit, url=url)
+
+    chunks: list[bytes] = []
+    total = 0
+    while True:
+        # Ask for one byte past the limit so an oversized body is detected
+        # without reading (much) more than the limit.
+        chunk = resp.read(min(_CHUNK_SIZE, limit + 1 - total))
+        if not chunk:
+            break
+        total += len(chunk)
+        if total > limit:
+            raise BodyTooLargeError(limit, url=url)
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _read_prefix(resp, limit: int) -> tuple[bytes, bool]:
+    try:
+        raw = resp.read(limit + 1)
+    except Exception:
+        return b"", False
+    if raw is None:
+        return b"", False
+    if len(raw) > limit:
+        return raw[:limit], True
+    return raw, False
 
 
-def _maybe_json(raw: bytes) -> object:
+def _maybe_json(raw: bytes, *, truncated: bool = False) -> object:
     if not raw:
         return None
+    if truncated:
+        return raw.decode("utf-8", errors="replace") + "... [truncated]"
     try:
         return json.loads(raw.decode("utf-8"))
     except Exception:
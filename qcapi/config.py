@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from .exceptions import ConfigError
@@ -71,6 +72,94 @@ def _select_ibm_cloud_account(accounts: dict[str, dict], account_name: str | Non
     return name, accounts[name]
 
 
+def _account_error(name: str, cfg: dict) -> str | None:
+    channel = cfg.get("channel")
+    if channel != "ibm_cloud":
+        return (
+            "Selected Qiskit account is not an IBM Cloud account. "
+            f"account={name!r} channel={channel!r}. "
+            "Pick an account with channel 'ibm_cloud' or set IBM_CLOUD_API_KEY/QCAPI_SERVICE_CRN env vars."
+        )
+    api_key = cfg.get("token")
+    service_crn = cfg.get("instance")
+    if not isinstance(api_key, str) or not api_key.strip():
+        return f"Missing/invalid token in Qiskit account {name!r}"
+    if not isinstance(service_crn, str) or not service_crn.strip():
+        return f"Missing/invalid instance (Service CRN) in Qiskit account {name!r}"
+    return None
+
+
+@dataclass(frozen=True)
+class _QiskitProfiles:
+    # (mtime_ns, size) of the file these profiles were parsed from.
+    stamp: tuple[int, int]
+    default_name: str
+    configs: dict[str, QcapiConfig] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    def get(self, name: str) -> QcapiConfig:
+        cfg = self.configs.get(name)
+        if cfg is not None:
+            return cfg
+        error = self.errors.get(name)
+        if error is not None:
+            raise ConfigError(error)
+        raise ConfigError(f"Account {name!r} not found in Qiskit config")
+
+
+_profiles_lock = threading.Lock()
+_profiles_cache: dict[tuple[Path, str | None, str | None], _QiskitProfiles] = {}
+
+
+def _file_stamp(path: Path) -> tuple[int, int]:
+    try:
+        st = path.stat()
+    except FileNotFoundError as e:
+        raise ConfigError(f"Qiskit config not found: {path}") from e
+    return st.st_mtime_ns, st.st_size
+
+
+def _qiskit_profiles(path: Path) -> _QiskitProfiles:
+    # Parse the Qiskit config once and resolve every profile up front; the
+    # result is reused until the file's mtime/size changes. Env overrides are
+    # part of the key because they end up baked into the resolved configs.
+    base_url_override = os.environ.get("QCAPI_BASE_URL") or None
+    api_version_override = os.environ.get("QCAPI_API_VERSION") or None
+    key = (path, base_url_override, api_version_override)
+    stamp = _file_stamp(path)
+
+    with _profiles_lock:
+        cached = _profiles_cache.get(key)
+        if cached is not None and cached.stamp == stamp:
+            return cached
+
+    accounts = _load_qiskit_accounts(path)
+    default_name, _ = _select_ibm_cloud_account(accounts, None)
+    profiles = _QiskitProfiles(stamp=stamp, default_name=default_name)
+    for name, cfg in accounts.items():
+        error = _account_error(name, cfg)
+        if error:
+            profiles.errors[name] = error
+            continue
+        service_crn = cfg["instance"]
+        profiles.configs[name] = QcapiConfig(
+            ibm_cloud_api_key=cfg["token"],
+            service_crn=service_crn,
+            base_url=base_url_override or _infer_base_url_from_crn(service_crn),
+            api_version=api_version_override or DEFAULT_API_VERSION,
+            account_name=name,
+        )
+
+    with _profiles_lock:
+        _profiles_cache[key] = profiles
+    return profiles
+
+
+def clear_config_cache() -> None:
+    with _profiles_lock:
+        _profiles_cache.clear()
+
+
 @dataclass(frozen=True)
 class QcapiConfig:
     ibm_cloud_api_key: str
@@ -102,35 +191,14 @@ class QcapiConfig:
 
     @classmethod
     def from_qiskit(cls, *, account_name: str | None = None) -> QcapiConfig:
-        path = _qiskit_config_path()
-        accounts = _load_qiskit_accounts(path)
+        profiles = _qiskit_profiles(_qiskit_config_path())
         env_account = os.environ.get("QCAPI_QISKIT_ACCOUNT")
-        name, cfg = _select_ibm_cloud_account(accounts, env_account or account_name)
-
-        channel = cfg.get("channel")
-        if channel != "ibm_cloud":
-            raise ConfigError(
-                "Selected Qiskit account is not an IBM Cloud account. "
-                f"account={name!r} channel={channel!r}. "
-                "Pick an account with channel 'ibm_cloud' or set IBM_CLOUD_API_KEY/QCAPI_SERVICE_CRN env vars."
-            )
-
-        api_key = cfg.get("token")
-        service_crn = cfg.get("instance")
-        if not isinstance(api_key, str) or not api_key.strip():
-            raise ConfigError(f"Missing/invalid token in Qiskit account {name!r}")
-        if not isinstance(service_crn, str) or not service_crn.strip():
-            raise ConfigError(f"Missing/invalid instance (Service CRN) in Qiskit account {name!r}")
-
-        base_url = os.environ.get("QCAPI_BASE_URL") or _infer_base_url_from_crn(service_crn)
-        api_version = os.environ.get("QCAPI_API_VERSION") or DEFAULT_API_VERSION
-        return cls(
-            ibm_cloud_api_key=api_key,
-            service_crn=service_crn,
-            base_url=base_url,
-            api_version=api_version,
-            account_name=name,
-        )
+        return profiles.get(env_account or account_name or profiles.default_name)
+
+    @classmethod
+    def all_accounts(cls) -> dict[str, QcapiConfig]:
+        # Only usable IBM Cloud accounts; the instances are shared between calls.
+        return dict(_qiskit_profiles(_qiskit_config_path()).configs)
 
     @classmethod
     def load(cls, *, account_name: str | None = None) -> QcapiConfig:
@@ -13,3 +13,17 @@ class HttpError(QcapiError):
         self.url = url
         self.body = body
 
+
+
+class BodyTooLargeError(HttpError):
+    # The response was fine but larger than the configured body limit.
+    def __init__(self, limit: int, *, url: str | None = None):
+        super().__init__(None, f"Response body exceeds {limit} bytes", url=url)
+        self.limit = limit
+
+
+class CircuitOpenError(HttpError):
+    # Raised without contacting the host while its circuit breaker is open.
+    def __init__(self, host: str, *, url: str | None = None):
+        super().__init__(None, f"Circuit open for {host}; failing fast", url=url)
+        self.host = host
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+
+
+# Normalized (see normalize_status); the API has used both the Qiskit Runtime
+# names and the older IBM Quantum ones over time.
+TERMINAL_JOB_STATUSES = frozenset({"COMPLETED", "DONE", "FAILED", "ERROR", "CANCELLED", "CANCELED"})
+SUCCESS_JOB_STATUSES = frozenset({"COMPLETED", "DONE"})
+
+
+def extract_items(payload: object, candidate_keys: tuple[str, ...]) -> list[dict[str, object]]:
+    if isinstance(payload, list):
+        return [item for item in payload if isinstance(item, dict)]
+    if isinstance(payload, dict):
+        for key in candidate_keys:
+            value = payload.get(key)
+            if isinstance(value, list):
+                return [item for item in value if isinstance(item, dict)]
+    return []
+
+
+def first_string(item: object, keys: tuple[str, ...]) -> str | None:
+    if not isinstance(item, dict):
+        return None
+    for key in keys:
+        value = item.get(key)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def job_backend_name(job: dict[str, object]) -> str | None:
+    backend = job.get("backend")
+    if isinstance(backend, str) and backend:
+        return backend
+    if isinstance(backend, dict):
+        nested = first_string(backend, ("name", "backend_name", "id"))
+        if nested:
+            return nested
+    return first_string(job, ("backend_name", "device", "target"))
+
+
+def job_program_id(job: dict[str, object]) -> str | None:
+    program = job.get("program")
+    if isinstance(program, dict):
+        nested = first_string(program, ("id", "name"))
+        if nested:
+            return nested
+    return first_string(job, ("program_id", "programId", "program"))
+
+
+def job_created(job: dict[str, object]) -> str | None:
+    return first_string(job, ("created", "created_at", "creation_date"))
+
+
+def parse_timestamp(value: str | None) -> datetime | None:
+    # API timestamps are ISO 8601 (usually with a trailing "Z"); naive values
+    # are taken to be UTC so they compare with the API's.
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def job_status(job: object) -> str | None:
+    if not isinstance(job, dict):
+        return None
+    for key in ("status", "state"):
+        value = job.get(key)
+        if isinstance(value, str) and value:
+            return value
+        if isinstance(value, dict):
+            nested = value.get("status")
+            if isinstance(nested, str) and nested:
+                return nested
+    return None
+
+
+def normalize_status(status: str | None) -> str:
+    # Upper-cased and without a reason suffix, so e.g. "Cancelled - Ran too
+    # long" becomes "CANCELLED".
+    if not status:
+        return ""
+    return status.split(" - ", 1)[0].strip().upper()
+
+
+def is_terminal_status(status: str | None) -> bool:
+    return normalize_status(status) in TERMINAL_JOB_STATUSES
+
+
+def job_quantum_seconds(payload: object) -> float:
+    # Works for both GET /jobs/{id} and GET /jobs/{id}/metrics payloads.
+    if not isinstance(payload, dict):
+        return 0.0
+    usage = payload.get("usage")
+    if isinstance(usage, dict):
+        for key in ("quantum_seconds", "seconds"):
+            value = usage.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return float(value)
+    value = payload.get("quantum_seconds")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return 0.0
+
+
+# Key fallbacks per JobRecord field, in order of preference. "backend",
+# "program" and "status" may also hold a nested object.
+_FIELD_KEYS: dict[str, tuple[str, ...]] = {
+    "id": ("id", "job_id", "jobId"),
+    "backend": ("backend", "backend_name", "device", "target"),
+    "status": ("status", "state"),
+    "created": ("created", "created_at", "creation_date"),
+    "program": ("program", "program_id", "programId"),
+}
+_NESTED_KEYS: dict[str, tuple[str, ...]] = {
+    "backend": ("name", "backend_name", "id"),
+    "status": ("status",),
+    "program": ("id", "name"),
+}
+_FIELDS = tuple(_FIELD_KEYS)
+
+JOB_SORT_KEYS = ("created", "-created", "backend", "status", "program")
+
+
+class JobRecord:
+    __slots__ = ("id", "backend", "status", "created", "program", "created_at")
+
+    def __init__(
+        self,
+        id: str,
+        backend: str | None,
+        status: str | None,
+        created: str | None,
+        program: str | None,
+    ):
+        self.id = id
+        self.backend = backend
+        self.status = status
+        self.created = created
+        self.program = program
+        self.created_at = parse_timestamp(created)
+
+    def as_row(self, *, include_program: bool = False) -> dict[str, object]:
+        row: dict[str, object] = {"id": self.id, "backend": self.backend}
+        if self.status:
+            row["status"] = self.status
+        if self.created:
+            row["created"] = self.created
+        if include_program and self.program:
+            row["program"] = self.program
+        return row
+
+
+def _field_value(job: dict[str, object], field: str, key: str) -> str | None:
+    value = job.get(key)
+    if isinstance(value, str) and value:
+        return value
+    if isinstance(value, dict) and field in _NESTED_KEYS:
+        return first_string(value, _NESTED_KEYS[field])
+    return None
+
+
+def _resolve_shape(keys: frozenset[str]) -> tuple[str | None, ...]:
+    return tuple(next((k for k in _FIELD_KEYS[field] if k in keys), None) for field in _FIELDS)
+
+
+def iter_job_records(items: Iterable[dict[str, object]]) -> Iterator[JobRecord]:
+    # Pages are nearly always homogeneous, so the key to read for each field
+    # is resolved once per distinct key set. An item only falls back to
+    # probing every candidate key when the resolved key holds no usable value.
+    shapes: dict[frozenset[str], tuple[str | None, ...]] = {}
+    for job in items:
+        keys = frozenset(job)
+        shape = shapes.get(keys)
+        if shape is None:
+            shape = shapes[keys] = _resolve_shape(keys)
+
+        values: list[str | None] = []
+        for field, key in zip(_FIELDS, shape):
+            value = _field_value(job, field, key) if key else None
+            if value is None and key is not None:
+                value = next(
+                    (v for k in _FIELD_KEYS[field] for v in [_field_value(job, field, k)] if v is not None),
+                    None,
+                )
+            values.append(value)
+
+        job_id, backend, status, created, program = values
+        if job_id:
+            yield JobRecord(job_id, backend, status, created, program)
+
+
+def job_records(items: Iterable[dict[str, object]]) -> list[JobRecord]:
+    return list(iter_job_records(items))
+
+
+class JobIndex:
+    # Records in API order plus position indexes on status (case-insensitive),
+    # backend and program, so filters intersect small position sets instead of
+    # re-inspecting every record.
+
+    def __init__(self, records: list[JobRecord]):
+        self.records = records
+        self._by_status: dict[str, list[int]] = {}
+        self._by_backend: dict[str, list[int]] = {}
+        self._by_program: dict[str, list[int]] = {}
+        for pos, record in enumerate(records):
+            if record.status:
+                self._by_status.setdefault(normalize_status(record.status), []).append(pos)
+            if record.backend:
+                self._by_backend.setdefault(record.backend, []).append(pos)
+            if record.program:
+                self._by_program.setdefault(record.program, []).append(pos)
+
+    def query(
+        self,
+        *,
+        statuses: Iterable[str] | None = None,
+        backends: Iterable[str] | None = None,
+        programs: Iterable[str] | None = None,
+        since: datetime | None = None,
+        sort: str | None = None,
+        limit: int | None = None,
+    ) -> list[JobRecord]:
+        candidates: set[int] | None = None
+        for index, wanted in (
+            (self._by_status, None if statuses is None else {normalize_status(s) for s in statuses}),
+            (self._by_backend, None if backends is None else set(backends)),
+            (self._by_program, None if programs is None else set(programs)),
+        ):
+            if wanted is None:
+                continue
+            positions = {pos for key in wanted for pos in index.get(key, ())}
+            candidates = positions if candidates is None else candidates & positions
+            if not candidates:
+                return []
+
+        positions = range(len(self.records)) if candidates is None else sorted(candidates)
+        out = [self.records[pos] for pos in positions]
+        if since is not None:
+            out = [r for r in out if r.created_at is not None and r.created_at >= since]
+        if sort:
+            out = _sort_records(out, sort)
+        return out if limit is None else out[:limit]
+
+
+def _sort_records(records: list[JobRecord], sort: str) -> list[JobRecord]:
+    if sort not in JOB_SORT_KEYS:
+        raise ValueError(f"Unknown sort key: {sort!r}")
+    descending = sort.startswith("-")
+    attr = sort.lstrip("-")
+    if attr == "created":
+        present = [r for r in records if r.created_at is not None]
+        missing = [r for r in records if r.created_at is None]
+        return sorted(present, key=lambda r: r.created_at, reverse=descending) + missing
+    return sorted(records, key=lambda r: (getattr(r, attr) is None, getattr(r, attr) or ""), reverse=descending)
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+
+from .client import QiskitRuntimeRestClient
+from .exceptions import CircuitOpenError, HttpError, QcapiError
+from .jobs import TERMINAL_JOB_STATUSES, is_terminal_status, job_quantum_seconds, job_status, normalize_status
+
+
+# A job that is seen running (or already finished) has left the queue.
+_STARTED_STATUSES = TERMINAL_JOB_STATUSES | {"RUNNING"}
+
+
+@dataclass
+class ScheduledJob:
+    job_id: str
+    submitted_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    status: str | None = None
+    quantum_seconds: float = 0.0
+    # Consecutive polls that failed or returned no recognizable status.
+    poll_failures: int = 0
+    # Set when the scheduler gave up waiting for a terminal status.
+    error: str | None = None
+    # True once the cancel for a given-up job was accepted (or the server
+    # said there was nothing left to cancel).
+    cancelled: bool = False
+
+    @property
+    def queue_wait_s(self) -> float | None:
+        if self.started_at is None:
+            return None
+        return self.started_at - self.submitted_at
+
+
+@dataclass
+class SessionReport:
+    session_id: str
+    started_at: float
+    finished_at: float | None = None
+    jobs: list[ScheduledJob] = field(default_factory=list)
+
+    @property
+    def wall_s(self) -> float:
+        end = self.finished_at if self.finished_at is not None else self.started_at
+        return max(end - self.started_at, 0.0)
+
+    @property
+    def throughput_jobs_per_s(self) -> float:
+        done = sum(1 for job in self.jobs if job.finished_at is not None)
+        return done / self.wall_s if self.wall_s else 0.0
+
+    @property
+    def mean_queue_wait_s(self) -> float | None:
+        waits = [w for w in (job.queue_wait_s for job in self.jobs) if w is not None]
+        return sum(waits) / len(waits) if waits else None
+
+    @property
+    def qpu_utilization(self) -> float:
+        # Share of the session's wall time spent executing on the QPU.
+        return sum(job.quantum_seconds for job in self.jobs) / self.wall_s if self.wall_s else 0.0
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "session_id": self.session_id,
+            "jobs": len(self.jobs),
+            "statuses": {job.job_id: job.status for job in self.jobs},
+            "errors": {job.job_id: job.error for job in self.jobs if job.error},
+            "cancelled": [job.job_id for job in self.jobs if job.cancelled],
+            "wall_s": round(self.wall_s, 3),
+            "throughput_jobs_per_s": round(self.throughput_jobs_per_s, 6),
+            "mean_queue_wait_s": None if self.mean_queue_wait_s is None else round(self.mean_queue_wait_s, 3),
+            "qpu_utilization": round(self.qpu_utilization, 4),
+        }
+
+
+class SessionScheduler:
+    # Keeps up to max_in_flight jobs queued in a single session: whenever a job
+    # reaches a terminal status the next spec from the stream is submitted, and
+    # the session is closed once the stream is drained (or on error).
+    #
+    # Job specs are keyword arguments for QiskitRuntimeRestClient.submit_job
+    # (program_id, backend, params, ...); session_id is filled in.
+    #
+    # A failed poll (HttpError) or a payload without a status is retried on
+    # the next tick. Fast-fails from an open circuit breaker are not counted:
+    # they say nothing about the job. After max_poll_failures in a row, or
+    # once a job has been in flight longer than max_job_wait_s, the job is
+    # given up on: its error is recorded and it is cancelled. Its slot is only
+    # reused once the cancel succeeds or a terminal status shows up, so the
+    # session never holds more than max_in_flight jobs.
+
+    def __init__(
+        self,
+        client: QiskitRuntimeRestClient,
+        *,
+        max_in_flight: int = 3,
+        poll_interval_s: float = 2.0,
+        max_poll_failures: int = 5,
+        max_job_wait_s: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        if max_poll_failures < 1:
+            raise ValueError("max_poll_failures must be >= 1")
+        self._client = client
+        self._max_poll_failures = max_poll_failures
+        self._max_job_wait_s = max_job_wait_s
+        self._max_in_flight = max_in_flight
+        self._poll_interval_s = poll_interval_s
+        self._clock = clock
+        self._sleep = sleep
+
+    def run(
+        self,
+        job_specs: Iterable[dict[str, object]],
+        *,
+        session_id: str | None = None,
+        **session_body: object,
+    ) -> SessionReport:
+        if session_id is None:
+            session_id = _require_id(self._client.create_session(**session_body), "session")
+        report = SessionReport(session_id=session_id, started_at=self._clock())
+        specs = iter(job_specs)
+        in_flight: dict[str, ScheduledJob] = {}
+
+        try:
+            self._fill(specs, in_flight, report)
+            while in_flight:
+                self._sleep(self._poll_interval_s)
+                for job_id in list(in_flight):
+                    if self._poll(in_flight[job_id]):
+                        del in_flight[job_id]
+                self._fill(specs, in_flight, report)
+        finally:
+            report.finished_at = self._clock()
+            self._client.close_session(session_id)
+        return report
+
+    def _poll(self, job: ScheduledJob) -> bool:
+        # Returns True once the job's slot can be reused.
+        payload: object = None
+        problem: str | None = None
+        try:
+            payload = self._client.get_job(job.job_id)
+        except CircuitOpenError:
+            pass
+        except HttpError as e:
+            problem = f"poll failed: {e} (status {e.status})"
+        else:
+            if not job_status(payload):
+                problem = "poll returned no job status"
+
+        now = self._clock()
+        status = job_status(payload)
+        if status:
+            job.poll_failures = 0
+            job.status = status
+            if job.started_at is None and normalize_status(status) in _STARTED_STATUSES:
+                job.started_at = now
+            if is_terminal_status(status):
+                job.finished_at = now
+                job.quantum_seconds = job_quantum_seconds(payload)
+                return True
+        elif problem is not None and job.error is None:
+            job.poll_failures += 1
+            if job.poll_failures >= self._max_poll_failures:
+                job.error = f"{problem}; gave up after {job.poll_failures} attempts"
+
+        if job.error is None and self._max_job_wait_s is not None and now - job.submitted_at > self._max_job_wait_s:
+            job.error = f"not finished after {self._max_job_wait_s}s"
+        if job.error is not None:
+            return self._cancel(job)
+        return False
+
+    def _cancel(self, job: ScheduledJob) -> bool:
+        # Retried every tick until the server accepts it; 404/409 mean the job
+        # is gone or already final, which frees the slot just the same.
+        try:
+            self._client.cancel_job(job.job_id)
+        except HttpError as e:
+            if e.status not in (404, 409):
+                return False
+        job.cancelled = True
+        return True
+
+    def _fill(self, specs: Iterator[dict[str, object]], in_flight: dict[str, ScheduledJob], report: SessionReport) -> None:
+        while len(in_flight) < self._max_in_flight:
+            spec = next(specs, None)
+            if spec is None:
+                return
+            submitted = self._client.submit_job(**{**spec, "session_id": report.session_id})
+            job = ScheduledJob(job_id=_require_id(submitted, "job"), submitted_at=self._clock())
+            in_flight[job.job_id] = job
+            report.jobs.append(job)
+
+
+def _require_id(payload: object, kind: str) -> str:
+    if isinstance(payload, dict):
+        value = payload.get("id")
+        if isinstance(value, str) and value:
+            return value
+    raise QcapiError(f"Create {kind} response has no id: {payload!r}")
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from .cache import ResultCache
+from .client import QiskitRuntimeRestClient
+from .exceptions import HttpError
+from .jobs import (
+    first_string,
+    is_terminal_status,
+    job_backend_name,
+    job_created,
+    job_program_id,
+    job_quantum_seconds,
+    job_status,
+    parse_timestamp,
+)
+
+
+# Metrics share the result cache directory; the prefix keeps their keys
+# apart from job results.
+_METRICS_KEY_PREFIX = "metrics:"
+
+
+@dataclass
+class UsageBucket:
+    jobs: int = 0
+    quantum_seconds: float = 0.0
+
+    def add(self, quantum_seconds: float) -> None:
+        self.jobs += 1
+        self.quantum_seconds += quantum_seconds
+
+    def as_dict(self) -> dict[str, object]:
+        return {"jobs": self.jobs, "quantum_seconds": round(self.quantum_seconds, 3)}
+
+
+class UsageReporter:
+    # Aggregates QPU seconds per backend, program and (UTC) day over a time
+    # range. Job metrics are fetched concurrently; metrics of terminal jobs
+    # can't change anymore and are memoized for the lifetime of the reporter.
+    # With a metrics_cache (the CLI passes the client's result cache) they are
+    # also persisted, so each finished job is only fetched once across runs.
+
+    def __init__(
+        self,
+        client: QiskitRuntimeRestClient,
+        *,
+        max_workers: int = 8,
+        metrics_cache: ResultCache | None = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self._client = client
+        self._max_workers = max_workers
+        self._metrics_cache = metrics_cache
+        self._memo: dict[str, object] = {}
+        self._memo_lock = threading.Lock()
+
+    def report(
+        self,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        backend: str | None = None,
+        program_id: str | None = None,
+    ) -> dict[str, object]:
+        since, until = _as_utc(since), _as_utc(until)
+        query = {
+            "created_after": since.isoformat() if since else None,
+            "created_before": until.isoformat() if until else None,
+            "backend": backend,
+            "program_id": program_id,
+        }
+        jobs = [job for job in self._client.iter_jobs(**query) if _in_range(job, since, until)]
+        metrics = self._fetch_metrics(jobs)
+
+        total = UsageBucket()
+        by_backend: dict[str, UsageBucket] = {}
+        by_program: dict[str, UsageBucket] = {}
+        by_day: dict[str, UsageBucket] = {}
+        missing_metrics = 0
+        # Single streaming pass over (job, metrics) pairs.
+        for job, job_metrics in zip(jobs, metrics):
+            if job_metrics is None:
+                missing_metrics += 1
+                seconds = job_quantum_seconds(job)
+            else:
+                seconds = job_quantum_seconds(job_metrics)
+            total.add(seconds)
+            by_backend.setdefault(job_backend_name(job) or "unknown", UsageBucket()).add(seconds)
+            by_program.setdefault(job_program_id(job) or "unknown", UsageBucket()).add(seconds)
+            by_day.setdefault(_day(job), UsageBucket()).add(seconds)
+
+        return {
+            "since": since.isoformat() if since else None,
+            "until": until.isoformat() if until else None,
+            "total": total.as_dict(),
+            "missing_metrics": missing_metrics,
+            "by_backend": {k: v.as_dict() for k, v in sorted(by_backend.items())},
+            "by_program": {k: v.as_dict() for k, v in sorted(by_program.items())},
+            "by_day": {k: v.as_dict() for k, v in sorted(by_day.items())},
+        }
+
+    def _fetch_metrics(self, jobs: list[dict[str, object]]) -> list[object | None]:
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            futures = []
+            for job in jobs:
+                job_id = first_string(job, ("id", "job_id", "jobId"))
+                terminal = is_terminal_status(job_status(job))
+                futures.append(pool.submit(self._metrics_for, job_id, terminal) if job_id else None)
+            return [future.result() if future else None for future in futures]
+
+    def _metrics_for(self, job_id: str, terminal: bool) -> object | None:
+        with self._memo_lock:
+            if job_id in self._memo:
+                return self._memo[job_id]
+        cache_key = _METRICS_KEY_PREFIX + job_id
+        if terminal and self._metrics_cache is not None:
+            metrics = self._metrics_cache.get(cache_key)
+            if metrics is not None:
+                with self._memo_lock:
+                    self._memo[job_id] = metrics
+                return metrics
+        try:
+            metrics = self._client.get_job_metrics(job_id)
+        except HttpError:
+            return None
+        if terminal:
+            with self._memo_lock:
+                self._memo[job_id] = metrics
+            if self._metrics_cache is not None and metrics is not None:
+                self._metrics_cache.put(cache_key, metrics)
+        return metrics
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _in_range(job: dict[str, object], since: datetime | None, until: datetime | None) -> bool:
+    # The API filters server-side too; this guards against it ignoring the params.
+    if since is None and until is None:
+        return True
+    created = parse_timestamp(job_created(job))
+    if created is None:
+        return True
+    if since is not None and created < since:
+        return False
+    if until is not None and created >= until:
+        return False
+    return True
+
+
+def _day(job: dict[str, object]) -> str:
+    created = parse_timestamp(job_created(job))
+    if created is None:
+        return "unknown"
+    return created.astimezone(timezone.utc).date().isoformat()
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from qcapi.cache import ResultCache
+from qcapi.client import QiskitRuntimeRestClient
+from qcapi.config import QcapiConfig
+
+
+def _client(cache: ResultCache) -> QiskitRuntimeRestClient:
+    cfg = QcapiConfig(ibm_cloud_api_key="k", service_crn="crn:v1:x", base_url="https://example.invalid/api/v1")
+    return QiskitRuntimeRestClient(cfg, result_cache=cache)
+
+
+class TestResultCache(unittest.TestCase):
+    def test_roundtrip_is_lazy(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cache = ResultCache(td)
+            cache.put("job-1", {"results": [1, 2, 3]})
+
+            entry = cache.open("job-1")
+            self.assertIsNotNone(entry)
+            self.assertNotIn("data", vars(entry))
+            self.assertEqual(entry.data, {"results": [1, 2, 3]})
+            self.assertIsNone(cache.open("job-2"))
+
+    def test_evicts_least_recently_used(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            payload = {"blob": "x" * 20_000}
+            probe = ResultCache(td)
+            probe.put("probe", payload)
+            entry_size = probe._path("probe").stat().st_size
+            probe.clear()
+
+            cache = ResultCache(td, max_bytes=entry_size * 2)
+            cache.put("a", payload)
+            cache.put("b", payload)
+            # Make "b" the least recently used entry.
+            os.utime(cache._path("a"), ns=(2_000_000_000, 2_000_000_000))
+            os.utime(cache._path("b"), ns=(1_000_000_000, 1_000_000_000))
+            cache.put("c", payload)
+
+            self.assertIsNotNone(cache.get("a"))
+            self.assertIsNone(cache.get("b"))
+            self.assertIsNotNone(cache.get("c"))
+
+
+class TestClientResultCache(unittest.TestCase):
+    def test_caches_results_of_terminal_jobs_only(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            client = _client(ResultCache(td))
+            responses = {
+                "/jobs/run-1": {"id": "run-1", "status": "Running"},
+                "/jobs/run-1/results": {"partial": True},
+                "/jobs/done-1": {"id": "done-1", "status": "Completed"},
+                "/jobs/done-1/results": {"results": [42]},
+            }
+            calls: list[str] = []
+
+            def fake_request(method: str, path: str, **kwargs: object) -> object:
+                calls.append(path)
+                return responses[path]
+
+            with mock.patch.object(client, "_request_json", side_effect=fake_request):
+                self.assertEqual(client.get_job_results("run-1"), {"partial": True})
+                self.assertEqual(client.get_job_results("run-1"), {"partial": True})
+                self.assertEqual(client.get_job_results("done-1"), {"results": [42]})
+                self.assertEqual(client.get_job_results("done-1"), {"results": [42]})
+
+            self.assertEqual(calls.count("/jobs/run-1/results"), 2)
+            self.assertEqual(calls.count("/jobs/done-1/results"), 1)
+            self.assertEqual(calls.count("/jobs/done-1"), 1)
+
+    def test_assume_terminal_skips_status_check(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            client = _client(ResultCache(td))
+            calls: list[str] = []
+
+            def fake_request(method: str, path: str, **kwargs: object) -> object:
+                calls.append(path)
+                return {"results": [1]}
+
+            with mock.patch.object(client, "_request_json", side_effect=fake_request):
+                client.get_job_results("done-1", assume_terminal=True)
+                client.get_job_results("done-1", assume_terminal=True)
+
+            self.assertEqual(calls, ["/jobs/done-1/results"])
@@ -1,7 +1,10 @@
 import argparse
+import contextlib
+import io
 import unittest
 
 from qcapi import cli
+from qcapi.client import JobEvent, JobOutcome
 
 
 class _FakeClient:
@@ -18,6 +21,137 @@ class _FakeClient:
         return self._jobs
 
 
+class _FakeCancelClient:
+    def __init__(self, jobs: list[dict[str, object]], failing: set[str] = frozenset()):
+        self._jobs = jobs
+        self._failing = failing
+        self.iter_jobs_calls: list[dict[str, object]] = []
+        self.cancelled: list[str] = []
+        self.jobs_yielded = 0
+
+    def iter_jobs(self, **query: object):
+        self.iter_jobs_calls.append(query)
+        for job in self._jobs:
+            self.jobs_yielded += 1
+            yield job
+
+    def cancel_jobs_many(self, job_ids, *, max_workers: int, progress):
+        outcomes = []
+        for i, job_id in enumerate(job_ids, start=1):
+            self.cancelled.append(job_id)
+            if job_id in self._failing:
+                outcome = JobOutcome(job_id, ok=False, status=409, error="conflict")
+            else:
+                outcome = JobOutcome(job_id, ok=True)
+            progress(i, len(job_ids), outcome)
+            outcomes.append(outcome)
+        return outcomes
+
+
+class _FakeFollowClient:
+    def __init__(self, events: list[object]):
+        self._events = events
+
+    def iter_interim_results(self, job_id: str, **kwargs: object):
+        for event in self._events:
+            if isinstance(event, BaseException):
+                raise event
+            yield event
+
+
+class TestCliJobFollow(unittest.TestCase):
+    def _args(self, **overrides: object) -> argparse.Namespace:
+        values = {"cmd": "job-follow", "job_id": "job-1", "max_interval": 5.0, "raw": True}
+        values.update(overrides)
+        return argparse.Namespace(**values)
+
+    def test_prints_events_and_returns_final_result(self) -> None:
+        client = _FakeFollowClient(
+            [
+                JobEvent("status", {"status": "Running"}),
+                JobEvent("interim", {"step": 1}),
+                JobEvent("status", {"status": "Completed"}),
+                JobEvent("result", {"results": [1]}),
+            ]
+        )
+
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            final = cli._run(client, self._args())
+
+        self.assertEqual(final, {"results": [1]})
+        self.assertEqual(
+            out.getvalue().splitlines(),
+            ['{"status": "Running"}', '{"interim": {"step": 1}}', '{"status": "Completed"}'],
+        )
+
+    def test_ctrl_c_exits_with_130(self) -> None:
+        client = _FakeFollowClient([JobEvent("status", {"status": "Running"}), KeyboardInterrupt()])
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaises(SystemExit) as ctx:
+                cli._run(client, self._args(raw=False))
+
+        self.assertEqual(ctx.exception.code, 130)
+
+
+class TestCliJobsCancel(unittest.TestCase):
+    def _args(self, **overrides: object) -> argparse.Namespace:
+        values = {
+            "cmd": "jobs-cancel",
+            "filter": "pending",
+            "backend": "ibm_torino",
+            "program_id": None,
+            "limit": None,
+            "workers": 4,
+            "dry_run": False,
+        }
+        values.update(overrides)
+        return argparse.Namespace(**values)
+
+    def test_selects_targets_and_summarizes_outcomes(self) -> None:
+        client = _FakeCancelClient(
+            jobs=[
+                {"id": "j1", "backend": "ibm_torino", "status": "Queued"},
+                {"id": "j2", "backend": "ibm_torino", "status": "Running"},
+                {"id": "j3", "backend": "ibm_torino", "status": "Queued"},
+            ],
+            failing={"j3"},
+        )
+
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            out = cli._run(client, self._args(filter="queued"))
+
+        self.assertEqual(client.iter_jobs_calls, [{"pending": "true", "backend": "ibm_torino", "program_id": None}])
+        self.assertEqual(client.cancelled, ["j1", "j3"])
+        self.assertEqual(out["cancelled"], 1)
+        self.assertEqual(out["failed"], 1)
+        self.assertEqual(out["outcomes"][1], {"id": "j3", "ok": False, "status": 409, "error": "conflict"})
+        self.assertIn("[2/2] j3 failed", err.getvalue())
+
+    def test_dry_run_does_not_cancel(self) -> None:
+        client = _FakeCancelClient(jobs=[{"id": "j1", "status": "Queued"}, {"id": "j2", "status": "Running"}])
+
+        out = cli._run(client, self._args(dry_run=True, limit=1))
+
+        self.assertEqual(out, {"selected": 1, "job_ids": ["j1"]})
+        self.assertEqual(client.cancelled, [])
+        self.assertEqual(client.jobs_yielded, 1)
+
+
+def _recent_args(**overrides: object) -> argparse.Namespace:
+    values = {
+        "cmd": "recent-quantum-jobs",
+        "limit": 5,
+        "status": None,
+        "since": None,
+        "program": None,
+        "exclude_simulators": True,
+        "sort": None,
+    }
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
 class TestCliRecentQuantumJobs(unittest.TestCase):
     def test_filters_simulators_and_applies_limit(self) -> None:
         client = _FakeClient(
@@ -38,7 +172,7 @@ class TestCliRecentQuantumJobs(unittest.TestCase):
             },
         )
 
-        args = argparse.Namespace(cmd="recent-quantum-jobs", limit=2)
+        args = _recent_args(limit=2)
         out = cli._run(client, args)
 
         self.assertEqual(
@@ -56,7 +190,7 @@ class TestCliRecentQuantumJobs(unittest.TestCase):
             jobs=[{"job_id": "abc123", "backend": {"name": "ibm_torino"}, "state": "DONE"}],
         )
 
-        args = argparse.Namespace(cmd="recent-quantum-jobs", limit=5)
+        args = _recent_args(limit=5)
         out = cli._run(client, args)
 
         self.assertEqual(out, [{"id": "abc123", "backend": "ibm_torino", "status": "DONE"}])
@@ -67,7 +201,7 @@ class TestCliRecentQuantumJobs(unittest.TestCase):
             jobs={"jobs": [{"id": "job-1", "backend": "ibmq_qasm_simulator"}]},
         )
 
-        args = argparse.Namespace(cmd="recent-quantum-jobs", limit=5)
+        args = _recent_args(limit=5)
         out = cli._run(client, args)
 
         self.assertEqual(out, [])
@@ -75,7 +209,55 @@ class TestCliRecentQuantumJobs(unittest.TestCase):
 
     def test_limit_must_be_positive(self) -> None:
         client = _FakeClient(backends=[], jobs=[])
-        args = argparse.Namespace(cmd="recent-quantum-jobs", limit=0)
+        args = _recent_args(limit=0)
 
         with self.assertRaises(SystemExit):
             cli._run(client, args)
+
+    def test_query_flags_filter_and_sort(self) -> None:
+        client = _FakeClient(
+            backends=[
+                {"name": "ibm_torino", "simulator": False},
+                {"name": "ibmq_qasm_simulator", "simulator": True},
+            ],
+            jobs=[
+                {"id": "j1", "backend": "ibm_torino", "status": "Completed", "program": {"id": "sampler"}, "created": "2026-10-01T10:00:00Z"},
+                {"id": "j2", "backend": "ibm_torino", "status": "Failed", "program": {"id": "sampler"}, "created": "2026-10-03T10:00:00Z"},
+                {"id": "j3", "backend": "ibm_torino", "status": "Completed", "program": {"id": "estimator"}, "created": "2026-10-04T10:00:00Z"},
+                {"id": "j4", "backend": "ibm_torino", "status": "Completed", "program": {"id": "sampler"}, "created": "2026-10-05T10:00:00Z"},
+                {"id": "j5", "backend": "ibmq_qasm_simulator", "status": "Completed", "program": {"id": "sampler"}, "created": "2026-10-06T10:00:00Z"},
+            ],
+        )
+
+        args = _recent_args(
+            limit=5,
+            status=["completed"],
+            since="2026-10-02",
+            program=["sampler"],
+            exclude_simulators=True,
+            sort="-created",
+        )
+        out = cli._run(client, args)
+
+        self.assertEqual([row["id"] for row in out], ["j4"])
+        self.assertEqual(out[0]["program"], "sampler")
+
+        args.exclude_simulators = False
+        out = cli._run(client, args)
+        self.assertEqual([row["id"] for row in out], ["j5", "j4"])
+
+        args.program = None
+        out = cli._run(client, args)
+        self.assertTrue(all("program" not in row for row in out))
+
+    def test_non_terminal_status_filter_includes_pending_jobs(self) -> None:
+        client = _FakeClient(
+            backends=[{"name": "ibm_torino", "simulator": False}],
+            jobs=[{"id": "j1", "backend": "ibm_torino", "status": "Queued"}],
+        )
+
+        args = _recent_args(limit=5, status=["queued"])
+        out = cli._run(client, args)
+
+        self.assertEqual(out, [{"id": "j1", "backend": "ibm_torino", "status": "Queued"}])
+        self.assertEqual(client.list_jobs_calls, [{"limit": 100, "pending": None}])
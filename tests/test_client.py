@@ -0,0 +1,345 @@
+import http.client
+import io
+import json
+import threading
+import unittest
+from unittest import mock
+
+import urllib.error
+
+from qcapi.client import CircuitBreaker, QiskitRuntimeRestClient
+from qcapi.config import QcapiConfig
+from qcapi.exceptions import BodyTooLargeError, CircuitOpenError, HttpError
+
+
+class _FakeResp:
+    def __init__(self, body: bytes, status: int = 200):
+        self._fp = io.BytesIO(body)
+        self.status = status
+        self.headers: dict[str, str] = {}
+        self.read_sizes: list[int] = []
+
+    def read(self, size: int = -1) -> bytes:
+        self.read_sizes.append(size)
+        return self._fp.read(size)
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+def _client(**kwargs: object) -> QiskitRuntimeRestClient:
+    cfg = QcapiConfig(ibm_cloud_api_key="k", service_crn="crn:v1:x", base_url="https://example.invalid/api/v1")
+    client = QiskitRuntimeRestClient(cfg, **kwargs)
+    client._token_provider.get_token = lambda: "t"  # type: ignore[method-assign]
+    return client
+
+
+class TestClientBodyLimits(unittest.TestCase):
+    def test_oversized_body_is_rejected_while_reading(self) -> None:
+        client = _client(max_body_bytes={"default": 100})
+        resp = _FakeResp(json.dumps({"x": "y" * 1000}).encode("utf-8"))
+
+        with mock.patch("urllib.request.urlopen", return_value=resp):
+            with self.assertRaises(HttpError) as ctx:
+                client.list_backends()
+
+        self.assertIsInstance(ctx.exception, BodyTooLargeError)
+        self.assertIsNone(ctx.exception.status)
+        self.assertEqual(ctx.exception.limit, 100)
+        self.assertEqual(resp.read_sizes, [101])
+
+    def test_results_endpoints_use_their_own_limit(self) -> None:
+        client = _client(max_body_bytes={"default": 10, "results": 1000})
+        body = json.dumps({"results": [1, 2, 3]}).encode("utf-8")
+
+        with mock.patch("urllib.request.urlopen", return_value=_FakeResp(body)):
+            self.assertEqual(client.get_job_results("job-1"), {"results": [1, 2, 3]})
+
+    def test_error_body_is_truncated(self) -> None:
+        client = _client(max_body_bytes={"error": 8})
+        err = urllib.error.HTTPError(
+            "https://example.invalid", 500, "boom", hdrs=None, fp=io.BytesIO(b'{"errors": ["' + b"x" * 500 + b'"]}')  # type: ignore[arg-type]
+        )
+
+        with mock.patch("urllib.request.urlopen", side_effect=err):
+            with self.assertRaises(HttpError) as ctx:
+                client.get_job("job-1")
+
+        self.assertEqual(ctx.exception.status, 500)
+        self.assertEqual(ctx.exception.body, '{"errors... [truncated]')
+
+    def test_stream_yields_chunks(self) -> None:
+        client = _client()
+
+        with mock.patch("urllib.request.urlopen", return_value=_FakeResp(b"abcdefghij")) as urlopen:
+            chunks = client.stream("GET", "/jobs/job-1/results", chunk_size=4)
+            urlopen.assert_not_called()
+            self.assertEqual(list(chunks), [b"abcd", b"efgh", b"ij"])
+
+
+class TestClientBulkJobs(unittest.TestCase):
+    def test_cancel_jobs_many_collects_outcomes_in_input_order(self) -> None:
+        client = _client()
+        seen: list[tuple[int, int, str]] = []
+
+        def fake_cancel(job_id: str) -> object:
+            if job_id == "bad":
+                raise HttpError(404, "HTTP request failed", url="https://example.invalid")
+            return None
+
+        with mock.patch.object(client, "cancel_job", side_effect=fake_cancel):
+            outcomes = client.cancel_jobs_many(
+                ["a", "bad", "b", "a"], max_workers=3, progress=lambda d, t, o: seen.append((d, t, o.job_id))
+            )
+
+        self.assertEqual([o.job_id for o in outcomes], ["a", "bad", "b"])
+        self.assertEqual([o.ok for o in outcomes], [True, False, True])
+        self.assertEqual(outcomes[1].status, 404)
+        self.assertEqual(sorted(d for d, _, _ in seen), [1, 2, 3])
+        self.assertTrue(all(t == 3 for _, t, _ in seen))
+
+
+    def test_non_http_error_does_not_abort_batch(self) -> None:
+        client = _client()
+
+        def fake_delete(job_id: str) -> object:
+            if job_id == "slow":
+                raise TimeoutError("timed out")
+            return None
+
+        with mock.patch.object(client, "delete_job", side_effect=fake_delete) as delete_job:
+            outcomes = client.delete_jobs_many(["a", "slow", "b"], max_workers=2)
+
+        self.assertEqual(delete_job.call_count, 3)
+        self.assertEqual([(o.job_id, o.ok) for o in outcomes], [("a", True), ("slow", False), ("b", True)])
+        self.assertIsNone(outcomes[1].status)
+        self.assertEqual(outcomes[1].error, "TimeoutError: timed out")
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_threshold_and_half_opens_after_reset(self) -> None:
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout_s=10.0, clock=lambda: now[0])
+
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "closed")
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+        self.assertFalse(breaker.allow())
+
+        now[0] = 10.0
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())  # only one probe while half-open
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+
+        now[0] = 20.0
+        self.assertTrue(breaker.allow())
+        breaker.record_success()
+        self.assertEqual(breaker.state, "closed")
+
+    def test_client_fails_fast_once_open(self) -> None:
+        client = _client(circuit_breaker_threshold=2)
+        err = urllib.error.URLError("connection refused")
+
+        with mock.patch("urllib.request.urlopen", side_effect=err) as urlopen:
+            for _ in range(3):
+                with self.assertRaises(HttpError):
+                    client.get_job("job-1")
+
+        self.assertEqual(urlopen.call_count, 2)
+
+    def test_garbled_response_counts_as_failure(self) -> None:
+        client = _client(circuit_breaker_threshold=1, circuit_breaker_reset_s=0.0)
+        errors = [urllib.error.URLError("connection refused"), http.client.BadStatusLine("garbage")]
+
+        def fake_urlopen(req, timeout):
+            if errors:
+                raise errors.pop(0)
+            return _FakeResp(b'{"ok": true}')
+
+        with mock.patch("urllib.request.urlopen", side_effect=fake_urlopen):
+            with self.assertRaises(HttpError):
+                client.get_job("job-1")
+            with self.assertRaises(HttpError):
+                client.get_job("job-1")
+            self.assertEqual(client.get_job("job-1"), {"ok": True})
+
+        self.assertEqual(client._breaker(client.config.base_url).state, "closed")
+
+    def test_caller_errors_release_probe_without_counting(self) -> None:
+        client = _client(circuit_breaker_threshold=2)
+        breaker = client._breaker(client.config.base_url)
+
+        with mock.patch("urllib.request.urlopen", side_effect=ValueError("unknown url type")):
+            for _ in range(3):
+                with self.assertRaises(ValueError):
+                    client.get_job("job-1")
+        self.assertEqual(breaker.state, "closed")
+
+    def test_release_frees_half_open_probe(self) -> None:
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_s=10.0, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 10.0
+
+        self.assertTrue(breaker.allow())
+        breaker.release()
+        self.assertEqual(breaker.state, "half-open")
+        self.assertTrue(breaker.allow())
+
+    def test_body_read_timeouts_trip_breaker(self) -> None:
+        client = _client(circuit_breaker_threshold=2)
+
+        class _StallingResp(_FakeResp):
+            def read(self, size: int = -1) -> bytes:
+                raise TimeoutError("timed out")
+
+        with mock.patch("urllib.request.urlopen", side_effect=lambda req, timeout: _StallingResp(b"")) as urlopen:
+            for _ in range(2):
+                with self.assertRaises(HttpError) as ctx:
+                    client.get_job("job-1")
+                self.assertIsInstance(ctx.exception.__cause__, TimeoutError)
+            with self.assertRaises(CircuitOpenError):
+                client.get_job("job-1")
+
+        self.assertEqual(urlopen.call_count, 2)
+        self.assertEqual(client._breaker(client.config.base_url).state, "open")
+
+    def test_client_errors_do_not_trip_breaker(self) -> None:
+        client = _client(circuit_breaker_threshold=1)
+        err = urllib.error.HTTPError("https://example.invalid", 404, "nope", hdrs=None, fp=io.BytesIO(b"{}"))  # type: ignore[arg-type]
+
+        with mock.patch("urllib.request.urlopen", side_effect=err) as urlopen:
+            for _ in range(3):
+                with self.assertRaises(HttpError):
+                    client.get_job("job-1")
+
+        self.assertEqual(urlopen.call_count, 3)
+
+
+class TestHedgedGets(unittest.TestCase):
+    def test_slow_get_is_hedged(self) -> None:
+        client = _client(hedge_gets=True, hedge_delay_s=0.05)
+        release = threading.Event()
+        calls: list[int] = []
+
+        def fake_urlopen(req, timeout):
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(5)
+                return _FakeResp(b'{"from": "first"}')
+            return _FakeResp(b'{"from": "hedge"}')
+
+        try:
+            with mock.patch("urllib.request.urlopen", side_effect=fake_urlopen):
+                self.assertEqual(client.get_job("job-1"), {"from": "hedge"})
+        finally:
+            release.set()
+        self.assertEqual(len(calls), 2)
+
+    def test_results_downloads_are_not_hedged_or_sampled(self) -> None:
+        client = _client(hedge_gets=True, hedge_delay_s=0.0)
+
+        with mock.patch("urllib.request.urlopen", return_value=_FakeResp(b"{}")) as urlopen:
+            client.get_job_results("job-1")
+
+        self.assertEqual(urlopen.call_count, 1)
+        self.assertEqual(client._latency, {})
+
+    def test_close_stops_hedging(self) -> None:
+        with _client(hedge_gets=True, hedge_delay_s=0.0) as client:
+            pass
+
+        with mock.patch("urllib.request.urlopen", side_effect=lambda req, timeout: _FakeResp(b"{}")) as urlopen:
+            client.get_job("job-1")
+
+        self.assertEqual(urlopen.call_count, 1)
+
+    def test_post_is_never_hedged(self) -> None:
+        client = _client(hedge_gets=True, hedge_delay_s=0.0)
+
+        with mock.patch("urllib.request.urlopen", return_value=_FakeResp(b"{}")) as urlopen:
+            client.cancel_job("job-1")
+
+        self.assertEqual(urlopen.call_count, 1)
+
+
+class TestIterInterimResults(unittest.TestCase):
+    def test_yields_only_new_entries_then_final_results(self) -> None:
+        client = _client()
+        statuses = iter(["Queued", "Running", "Running", "Running", "Completed"])
+        interim = iter([["a"], ["a"], ["a", "b", "c"], ["a", "b", "c", "d"]])
+
+        with (
+            mock.patch.object(client, "get_job", side_effect=lambda job_id: {"id": job_id, "status": next(statuses)}),
+            mock.patch.object(client, "get_job_interim_results", side_effect=lambda job_id: next(interim)),
+            mock.patch.object(client, "get_job_results", return_value={"results": "final"}),
+            mock.patch("qcapi.client.time.sleep") as sleep,
+        ):
+            events = list(client.iter_interim_results("job-1", min_interval_s=1.0, max_interval_s=4.0, queued_interval_s=5.0))
+
+        self.assertEqual(
+            [(e.kind, e.data if e.kind != "status" else e.data["status"]) for e in events],
+            [
+                ("status", "Queued"),
+                ("status", "Running"),
+                ("interim", "a"),
+                ("interim", "b"),
+                ("interim", "c"),
+                ("status", "Completed"),
+                ("interim", "d"),
+                ("result", {"results": "final"}),
+            ],
+        )
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [5.0, 1.0, 1.5, 1.0])
+
+    def test_failed_job_ends_with_status(self) -> None:
+        client = _client()
+
+        with (
+            mock.patch.object(client, "get_job", return_value={"id": "job-1", "status": "Failed"}),
+            mock.patch.object(client, "get_job_interim_results", side_effect=HttpError(404, "not found")),
+            mock.patch.object(client, "get_job_results") as get_results,
+        ):
+            events = list(client.iter_interim_results("job-1"))
+
+        self.assertEqual([e.kind for e in events], ["status"])
+        get_results.assert_not_called()
+
+
+class TestIterJobs(unittest.TestCase):
+    def _paged_client(self, pages: dict[int, list[dict[str, object]]], *, ignore_skip: bool = False):
+        client = _client()
+        calls: list[dict[str, object]] = []
+
+        def fake_list_jobs(**query: object) -> object:
+            calls.append(query)
+            skip = 0 if ignore_skip else int(query["skip"])
+            return {"jobs": pages.get(skip, [])}
+
+        client.list_jobs = fake_list_jobs  # type: ignore[method-assign]
+        return client, calls
+
+    def test_walks_pages_even_when_server_caps_limit(self) -> None:
+        # Server returns 2 jobs per page although 100 were asked for.
+        client, calls = self._paged_client({0: [{"id": "a"}, {"id": "b"}], 2: [{"id": "c"}, {"id": "d"}], 4: [{"id": "e"}]})
+
+        ids = [job["id"] for job in client.iter_jobs(pending="true")]
+
+        self.assertEqual(ids, ["a", "b", "c", "d", "e"])
+        self.assertEqual([c["skip"] for c in calls], [0, 2, 4, 5])
+        self.assertTrue(all(c["pending"] == "true" and c["limit"] == 100 for c in calls))
+
+    def test_stops_when_server_ignores_skip(self) -> None:
+        client, calls = self._paged_client({0: [{"id": "a"}, {"id": "b"}]}, ignore_skip=True)
+
+        ids = [job["id"] for job in client.iter_jobs(page_size=2)]
+
+        self.assertEqual(ids, ["a", "b"])
+        self.assertEqual(len(calls), 2)
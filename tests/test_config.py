@@ -4,13 +4,14 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from qcapi.config import QcapiConfig
+from qcapi.config import QcapiConfig, clear_config_cache
 from qcapi.exceptions import ConfigError
 
 
 class TestConfig(unittest.TestCase):
     def setUp(self) -> None:
         self._env_backup = dict(os.environ)
+        clear_config_cache()
 
     def tearDown(self) -> None:
         os.environ.clear()
@@ -61,6 +62,50 @@ class TestConfig(unittest.TestCase):
             with self.assertRaises(ConfigError):
                 QcapiConfig.from_qiskit()
 
+    def test_from_qiskit_reuses_parsed_profiles_until_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "qiskit-ibm.json"
+            p.write_text(
+                json.dumps({"a": {"channel": "ibm_cloud", "token": "k1", "instance": "crn:v1:...:us-east:a/..."}}),
+                encoding="utf-8",
+            )
+            os.environ["QCAPI_QISKIT_CONFIG_PATH"] = str(p)
+
+            cfg1 = QcapiConfig.from_qiskit()
+            cfg2 = QcapiConfig.from_qiskit(account_name="a")
+            self.assertIs(cfg1, cfg2)
+
+            p.write_text(
+                json.dumps({"a": {"channel": "ibm_cloud", "token": "k1-rotated", "instance": "crn:v1:...:us-east:a/..."}}),
+                encoding="utf-8",
+            )
+            st = p.stat()
+            os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+            cfg3 = QcapiConfig.from_qiskit()
+            self.assertEqual(cfg3.ibm_cloud_api_key, "k1-rotated")
+
+    def test_all_accounts_skips_unusable_profiles(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "qiskit-ibm.json"
+            p.write_text(
+                json.dumps(
+                    {
+                        "cloud-us": {"channel": "ibm_cloud", "token": "k1", "instance": "crn:v1:...:us-east:a/..."},
+                        "cloud-eu": {"channel": "ibm_cloud", "token": "k2", "instance": "crn:v1:...:eu-de:a/..."},
+                        "legacy": {"channel": "ibm_quantum", "token": "t", "instance": "ibm-q/open/main"},
+                    }
+                ),
+                encoding="utf-8",
+            )
+            os.environ["QCAPI_QISKIT_CONFIG_PATH"] = str(p)
+
+            accounts = QcapiConfig.all_accounts()
+            self.assertEqual(sorted(accounts), ["cloud-eu", "cloud-us"])
+            self.assertIs(accounts["cloud-eu"], QcapiConfig.from_qiskit(account_name="cloud-eu"))
+            with self.assertRaises(ConfigError):
+                QcapiConfig.from_qiskit(account_name="legacy")
+
     def test_load_prefers_env(self) -> None:
         os.environ["IBM_CLOUD_API_KEY"] = "env-k"
         os.environ["QCAPI_SERVICE_CRN"] = "crn:v1:...:us-east:a/..."
@@ -0,0 +1,13 @@
+import unittest
+
+from qcapi.jobs import is_terminal_status, normalize_status
+
+
+class TestJobStatus(unittest.TestCase):
+    def test_cancelled_with_reason_is_terminal(self) -> None:
+        self.assertEqual(normalize_status("Cancelled - Ran too long"), "CANCELLED")
+        self.assertTrue(is_terminal_status("Cancelled - Ran too long"))
+
+    def test_non_terminal_statuses(self) -> None:
+        for status in ("Queued", "Running", "", None):
+            self.assertFalse(is_terminal_status(status))
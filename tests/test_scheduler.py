@@ -0,0 +1,182 @@
+import unittest
+
+from qcapi.exceptions import CircuitOpenError, HttpError
+from qcapi.scheduler import SessionScheduler
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class _FakeSessionClient:
+    # Each job is queued for one poll, running for one poll, then completed.
+    def __init__(self) -> None:
+        self.submitted: list[dict[str, object]] = []
+        self.closed: list[str] = []
+        self.cancelled: list[str] = []
+        self.polls: dict[str, int] = {}
+        self.max_concurrent = 0
+
+    def create_session(self, **body: object) -> object:
+        return {"id": "sess-1", **body}
+
+    def close_session(self, session_id: str) -> object:
+        self.closed.append(session_id)
+        return None
+
+    def submit_job(self, **body: object) -> object:
+        self.submitted.append(body)
+        job_id = f"job-{len(self.submitted)}"
+        self.polls[job_id] = 0
+        active = sum(1 for polls in self.polls.values() if polls < 3)
+        self.max_concurrent = max(self.max_concurrent, active)
+        return {"id": job_id}
+
+    def cancel_job(self, job_id: str) -> object:
+        self.cancelled.append(job_id)
+        return None
+
+    def get_job(self, job_id: str) -> object:
+        self.polls[job_id] += 1
+        status = {1: "Queued", 2: "Running"}.get(self.polls[job_id], "Completed")
+        return {"id": job_id, "status": status, "usage": {"quantum_seconds": 1.5}}
+
+
+class TestSessionScheduler(unittest.TestCase):
+    def test_keeps_jobs_in_flight_and_closes_session(self) -> None:
+        client = _FakeSessionClient()
+        clock = _FakeClock()
+        scheduler = SessionScheduler(client, max_in_flight=2, poll_interval_s=1.0, clock=clock, sleep=clock.sleep)
+
+        specs = ({"program_id": "sampler", "backend": "ibm_torino", "params": {"i": i}} for i in range(5))
+        report = scheduler.run(specs, mode="batch")
+
+        self.assertEqual(report.session_id, "sess-1")
+        self.assertEqual(client.closed, ["sess-1"])
+        self.assertEqual(len(client.submitted), 5)
+        self.assertTrue(all(body["session_id"] == "sess-1" for body in client.submitted))
+        self.assertEqual(client.max_concurrent, 2)
+        self.assertEqual({job.status for job in report.jobs}, {"Completed"})
+        self.assertEqual(report.mean_queue_wait_s, 2.0)
+        self.assertAlmostEqual(report.qpu_utilization, 5 * 1.5 / report.wall_s)
+        self.assertGreater(report.throughput_jobs_per_s, 0)
+
+    def test_closes_session_when_submit_fails(self) -> None:
+        client = _FakeSessionClient()
+
+        def boom(**body: object) -> object:
+            raise RuntimeError("submit failed")
+
+        client.submit_job = boom  # type: ignore[method-assign]
+        scheduler = SessionScheduler(client, sleep=lambda s: None)
+
+        with self.assertRaises(RuntimeError):
+            scheduler.run([{"program_id": "sampler", "backend": "ibm_torino", "params": {}}])
+        self.assertEqual(client.closed, ["sess-1"])
+
+    def test_transient_poll_failure_is_retried(self) -> None:
+        client = _FakeSessionClient()
+        get_job = client.get_job
+        failures = {"job-1": 1}
+
+        def flaky_get_job(job_id: str) -> object:
+            if failures.get(job_id):
+                failures[job_id] -= 1
+                raise HttpError(503, "HTTP request failed")
+            return get_job(job_id)
+
+        client.get_job = flaky_get_job  # type: ignore[method-assign]
+        scheduler = SessionScheduler(client, max_in_flight=2, sleep=lambda s: None)
+
+        specs = [{"program_id": "sampler", "backend": "ibm_torino", "params": {}} for _ in range(2)]
+        report = scheduler.run(specs)
+
+        self.assertEqual({job.status for job in report.jobs}, {"Completed"})
+        self.assertEqual(report.summary()["errors"], {})
+        self.assertEqual(report.summary()["cancelled"], [])
+        self.assertEqual(client.closed, ["sess-1"])
+
+    def test_gives_up_on_job_that_never_reports_status(self) -> None:
+        client = _FakeSessionClient()
+        client.get_job = lambda job_id: {"id": job_id}  # type: ignore[method-assign]
+        scheduler = SessionScheduler(client, max_poll_failures=3, sleep=lambda s: None)
+
+        report = scheduler.run([{"program_id": "sampler", "backend": "ibm_torino", "params": {}}])
+
+        self.assertEqual(len(report.jobs), 1)
+        self.assertIn("no job status", report.jobs[0].error)
+        self.assertIsNone(report.jobs[0].finished_at)
+        self.assertTrue(report.jobs[0].cancelled)
+        self.assertEqual(client.cancelled, ["job-1"])
+        self.assertEqual(client.closed, ["sess-1"])
+
+    def test_max_job_wait_bounds_a_stuck_job(self) -> None:
+        client = _FakeSessionClient()
+        client.get_job = lambda job_id: {"id": job_id, "status": "Queued"}  # type: ignore[method-assign]
+        clock = _FakeClock()
+        scheduler = SessionScheduler(client, poll_interval_s=1.0, max_job_wait_s=10.0, clock=clock, sleep=clock.sleep)
+
+        report = scheduler.run([{"program_id": "sampler", "backend": "ibm_torino", "params": {}}])
+
+        self.assertIn("not finished after", report.jobs[0].error)
+        self.assertEqual(client.cancelled, ["job-1"])
+        self.assertEqual(clock.now, 11.0)
+
+    def test_given_up_job_keeps_its_slot_until_cancel_succeeds(self) -> None:
+        client = _FakeSessionClient()
+        client.get_job = lambda job_id: {"id": job_id}  # type: ignore[method-assign]
+        cancel_failures = {"job-1": 2}
+
+        def flaky_cancel(job_id: str) -> object:
+            if cancel_failures.get(job_id):
+                cancel_failures[job_id] -= 1
+                raise HttpError(503, "HTTP request failed")
+            client.cancelled.append(job_id)
+            return None
+
+        client.cancel_job = flaky_cancel  # type: ignore[method-assign]
+        submitted_while_job1_held: list[int] = []
+        submit_job = client.submit_job
+
+        def tracking_submit(**body: object) -> object:
+            if "job-1" in client.polls and "job-1" not in client.cancelled:
+                submitted_while_job1_held.append(len(client.submitted))
+            return submit_job(**body)
+
+        client.submit_job = tracking_submit  # type: ignore[method-assign]
+        scheduler = SessionScheduler(client, max_in_flight=1, max_poll_failures=1, sleep=lambda s: None)
+
+        specs = [{"program_id": "sampler", "backend": "ibm_torino", "params": {}} for _ in range(2)]
+        report = scheduler.run(specs)
+
+        self.assertEqual(submitted_while_job1_held, [])
+        self.assertEqual(client.cancelled, ["job-1", "job-2"])
+        self.assertEqual(len(report.jobs), 2)
+
+    def test_circuit_open_fast_fails_do_not_count_as_poll_failures(self) -> None:
+        client = _FakeSessionClient()
+        get_job = client.get_job
+        fast_fails = [10]
+
+        def breaker_open_then_ok(job_id: str) -> object:
+            if fast_fails[0]:
+                fast_fails[0] -= 1
+                raise CircuitOpenError("example.invalid")
+            return get_job(job_id)
+
+        client.get_job = breaker_open_then_ok  # type: ignore[method-assign]
+        scheduler = SessionScheduler(client, max_in_flight=2, max_poll_failures=3, sleep=lambda s: None)
+
+        specs = [{"program_id": "sampler", "backend": "ibm_torino", "params": {}} for _ in range(6)]
+        report = scheduler.run(specs)
+
+        self.assertEqual(client.cancelled, [])
+        self.assertEqual(client.max_concurrent, 2)
+        self.assertEqual({job.status for job in report.jobs}, {"Completed"})
@@ -0,0 +1,81 @@
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+from qcapi.cache import ResultCache
+from qcapi.usage import UsageReporter
+
+
+class _FakeUsageClient:
+    def __init__(self, jobs: list[dict[str, object]], metrics: dict[str, object]):
+        self._jobs = jobs
+        self._metrics = metrics
+        self.iter_jobs_calls: list[dict[str, object]] = []
+        self.metrics_calls: list[str] = []
+
+    def iter_jobs(self, **query: object):
+        self.iter_jobs_calls.append(query)
+        return iter(self._jobs)
+
+    def get_job_metrics(self, job_id: str) -> object:
+        self.metrics_calls.append(job_id)
+        return self._metrics[job_id]
+
+
+class TestUsageReporter(unittest.TestCase):
+    def _client(self) -> _FakeUsageClient:
+        return _FakeUsageClient(
+            jobs=[
+                {"id": "j1", "backend": "ibm_torino", "program": {"id": "sampler"}, "status": "Completed", "created": "2026-10-01T10:00:00Z"},
+                {"id": "j2", "backend": "ibm_torino", "program": {"id": "estimator"}, "status": "Completed", "created": "2026-10-01T23:00:00Z"},
+                {"id": "j3", "backend": "ibm_brisbane", "program": {"id": "sampler"}, "status": "Running", "created": "2026-10-02T08:00:00Z"},
+                {"id": "old", "backend": "ibm_torino", "status": "Completed", "created": "2026-09-01T00:00:00Z"},
+            ],
+            metrics={
+                "j1": {"usage": {"quantum_seconds": 4}},
+                "j2": {"usage": {"quantum_seconds": 6}},
+                "j3": {"usage": {"quantum_seconds": 1.5}},
+            },
+        )
+
+    def test_rolls_up_by_backend_program_and_day(self) -> None:
+        client = self._client()
+        out = UsageReporter(client, max_workers=2).report(since=datetime(2026, 10, 1, tzinfo=timezone.utc))
+
+        self.assertEqual(client.iter_jobs_calls[0]["created_after"], "2026-10-01T00:00:00+00:00")
+        self.assertEqual(out["total"], {"jobs": 3, "quantum_seconds": 11.5})
+        self.assertEqual(
+            out["by_backend"],
+            {"ibm_brisbane": {"jobs": 1, "quantum_seconds": 1.5}, "ibm_torino": {"jobs": 2, "quantum_seconds": 10.0}},
+        )
+        self.assertEqual(
+            out["by_program"],
+            {"estimator": {"jobs": 1, "quantum_seconds": 6.0}, "sampler": {"jobs": 2, "quantum_seconds": 5.5}},
+        )
+        self.assertEqual(
+            out["by_day"],
+            {"2026-10-01": {"jobs": 2, "quantum_seconds": 10.0}, "2026-10-02": {"jobs": 1, "quantum_seconds": 1.5}},
+        )
+
+    def test_memoizes_metrics_of_terminal_jobs(self) -> None:
+        client = self._client()
+        reporter = UsageReporter(client)
+        since = datetime(2026, 10, 1)
+
+        reporter.report(since=since)
+        reporter.report(since=since)
+
+        self.assertEqual(sorted(client.metrics_calls), ["j1", "j2", "j3", "j3"])
+
+    def test_persists_terminal_metrics_across_reporters(self) -> None:
+        client = self._client()
+        since = datetime(2026, 10, 1)
+
+        with tempfile.TemporaryDirectory() as td:
+            UsageReporter(client, metrics_cache=ResultCache(td)).report(since=since)
+            out = UsageReporter(client, metrics_cache=ResultCache(td)).report(since=since)
+
+            self.assertIsNone(ResultCache(td).get("j1"))
+
+        self.assertEqual(sorted(client.metrics_calls), ["j1", "j2", "j3", "j3"])
+        self.assertEqual(out["total"], {"jobs": 3, "quantum_seconds": 11.5})